@@ -0,0 +1,89 @@
+"""pytest-benchmark suite for the fields' conversion and initialization paths.
+
+Run with `pytest benchmarks --no-cov`. See the README for saving and comparing runs.
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+from django.db import connection
+
+from django_choices_field.choices import FlagChoices, _shared_choices
+from django_choices_field.fields import IntegerChoicesFlagField
+from django_choices_field.types import IntegerChoicesFlag
+from tests.models import MyModel
+
+VALUES = 10_000
+
+# The field, a member and its value as stored in the database
+FIELDS = {
+    "text": ("c_field", MyModel.TextEnum.C_BAR, "bar"),
+    "compact_text": ("cc_field", MyModel.TextEnum.C_BAR, 2),
+    "integer": ("i_field", MyModel.IntegerEnum.I_BAR, 2),
+    "flag": ("if_field", MyModel.IntegerFlagEnum(5), 5),
+}
+
+
+def _make_flag_enum(size: int) -> type[IntegerChoicesFlag]:
+    return IntegerChoicesFlag(  # type: ignore
+        f"Flags{size}",
+        [(f"F_{i}", (1 << i, f"Flag {i}")) for i in range(size)],
+    )
+
+
+@pytest.mark.parametrize("kind", FIELDS)
+def test_to_python(benchmark, kind: str):
+    fname, member, _raw = FIELDS[kind]
+    field = MyModel._meta.get_field(fname)
+    values = [member.value] * VALUES
+    benchmark(lambda: [field.to_python(v) for v in values])
+
+
+@pytest.mark.parametrize("kind", FIELDS)
+def test_from_db_value(benchmark, kind: str):
+    fname, _member, raw = FIELDS[kind]
+    field = MyModel._meta.get_field(fname)
+    values = [raw] * VALUES
+    benchmark(lambda: [field.from_db_value(v, None, connection) for v in values])
+
+
+@pytest.mark.parametrize("kind", FIELDS)
+def test_get_prep_value(benchmark, kind: str):
+    fname, member, _raw = FIELDS[kind]
+    field = MyModel._meta.get_field(fname)
+    values = [member] * VALUES
+    benchmark(lambda: [field.get_prep_value(v) for v in values])
+
+
+@pytest.mark.parametrize("size", [4, 8, 16, 24])
+def test_flag_field_init(benchmark, size: int):
+    choices_enum = _make_flag_enum(size)
+
+    def setup():
+        # Without the choices shared by previous fields using the same enum
+        _shared_choices.pop(choices_enum, None)
+
+    benchmark.pedantic(
+        lambda: IntegerChoicesFlagField(choices_enum=choices_enum),
+        setup=setup,
+        rounds=100,
+    )
+
+
+@pytest.mark.parametrize("size", [4, 8, 12, 16])
+def test_expanded_flag_choices(benchmark, size: int):
+    choices = FlagChoices(_make_flag_enum(size))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        expanded = list(choices)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del expanded
+
+    benchmark.extra_info["choices"] = len(choices)
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    benchmark.pedantic(lambda: list(choices), rounds=5)
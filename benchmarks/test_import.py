@@ -0,0 +1,69 @@
+"""pytest-benchmark suite for the startup cost of fields declared with `choices=`.
+
+Declaring the models of a generated module, which is what importing it does during
+`django.setup()`, is timed against a fresh app registry on each round. Creating the
+enums of all its fields, which is deferred until they are first needed, is timed
+separately.
+
+Run with `pytest benchmarks --no-cov`. See the README for saving and comparing runs.
+"""
+
+from django.apps.registry import Apps
+
+from django_choices_field.fields import _shared_choices_enums
+
+MODELS = 100
+FIELDS = 10
+
+
+def _make_source() -> str:
+    lines = [
+        "from django.db import models",
+        "",
+        "from django_choices_field import IntegerChoicesField, TextChoicesField",
+    ]
+    for i in range(MODELS):
+        lines += ["", "", f"class Model{i}(models.Model):"]
+        for j in range(FIELDS):
+            if j % 2:
+                choices = [(k, f"Label {k}") for k in range(j + 2)]
+                lines.append(f"    i_{j} = IntegerChoicesField(choices={choices!r})")
+            else:
+                choices = [(f"value_{k}", f"Label {k}") for k in range(j + 2)]
+                lines.append(f"    t_{j} = TextChoicesField(choices={choices!r})")
+        lines += [
+            "",
+            "    class Meta:",
+            '        app_label = "bench_app"',
+            "        apps = apps",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+CODE = compile(_make_source(), "bench_app/models.py", "exec")
+
+
+def _declare_models() -> list[type]:
+    apps = Apps()
+    exec(CODE, {"__name__": "bench_app.models", "apps": apps})  # noqa: S102
+    return list(apps.all_models["bench_app"].values())
+
+
+def test_declare_models(benchmark):
+    def setup():
+        _shared_choices_enums.clear()
+
+    assert len(benchmark.pedantic(_declare_models, setup=setup, rounds=10)) == MODELS
+
+
+def test_create_choices_enums(benchmark):
+    def setup():
+        _shared_choices_enums.clear()
+        fields = [f for m in _declare_models() for f in m._meta.fields]
+        return (fields,), {}
+
+    def create_enums(fields):
+        for field in fields:
+            getattr(field, "choices_enum", None)
+
+    benchmark.pedantic(create_enums, setup=setup, rounds=10)
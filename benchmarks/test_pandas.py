@@ -0,0 +1,73 @@
+"""pytest-benchmark suite for converting raw choices columns into pandas objects.
+
+Compares the helpers from `django_choices_field.contrib.pandas` with converting
+each value through `to_python` and building the pandas objects from the result.
+
+Run with `pytest benchmarks --no-cov`. Skipped when pandas is not installed.
+"""
+
+import random
+
+import pytest
+
+from django_choices_field.fields import IntegerChoicesFlagField
+from tests.models import MyModel
+
+pd = pytest.importorskip("pandas")
+
+from django_choices_field.contrib.pandas import decompose_flags, to_categorical  # noqa: E402
+
+ROWS = 100_000
+
+# The field and the raw values its column can contain
+FIELDS = {
+    "text": ("c_field", ["foo", "bar"]),
+    "integer": ("i_field", [1, 2]),
+    "flag": ("if_field", list(range(1, 8))),
+}
+
+
+def _get_label(field, value):
+    member = field.to_python(value)
+    if isinstance(field, IntegerChoicesFlagField):
+        # Composite flags don't have a label of their own
+        return str(field.choices.get(member.value))
+    return str(member.label)
+
+
+def _make_values(choices: list) -> list:
+    rng = random.Random(0)
+    return [rng.choice(choices) for _ in range(ROWS)]
+
+
+@pytest.mark.parametrize("kind", FIELDS)
+def test_per_row_categorical(benchmark, kind: str):
+    fname, choices = FIELDS[kind]
+    field = MyModel._meta.get_field(fname)
+    values = _make_values(choices)
+    benchmark(lambda: pd.Categorical([_get_label(field, v) for v in values]))
+
+
+@pytest.mark.parametrize("kind", FIELDS)
+def test_to_categorical(benchmark, kind: str):
+    fname, choices = FIELDS[kind]
+    field = MyModel._meta.get_field(fname)
+    values = _make_values(choices)
+    benchmark(lambda: to_categorical(field, values))
+
+
+def test_per_row_flag_columns(benchmark):
+    field = MyModel._meta.get_field("if_field")
+    members = list(field.choices_enum)
+    values = _make_values(FIELDS["flag"][1])
+    benchmark(
+        lambda: pd.DataFrame(
+            {m.name: [m in field.to_python(v) for v in values] for m in members},
+        ),
+    )
+
+
+def test_decompose_flags(benchmark):
+    field = MyModel._meta.get_field("if_field")
+    values = _make_values(FIELDS["flag"][1])
+    benchmark(lambda: decompose_flags(field, values))
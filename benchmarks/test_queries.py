@@ -0,0 +1,62 @@
+"""pytest-benchmark suite for writing and reading rows on SQLite.
+
+Run with `pytest benchmarks --no-cov`. See the README for saving and comparing runs.
+"""
+
+import pytest
+
+from tests.models import MyModel
+
+ROWS = 5_000
+
+
+def _make_objects() -> list[MyModel]:
+    return [
+        MyModel(
+            c_field=list(MyModel.TextEnum)[i % 2],
+            i_field=list(MyModel.IntegerEnum)[i % 2],
+            if_field=list(MyModel.IntegerFlagEnum)[i % 3],
+        )
+        for i in range(ROWS)
+    ]
+
+
+@pytest.fixture
+def rows(db):
+    MyModel.objects.bulk_create(_make_objects())
+
+
+def test_bulk_create(benchmark, db):
+    def setup():
+        MyModel.objects.all().delete()
+        return (_make_objects(),), {}
+
+    benchmark.pedantic(MyModel.objects.bulk_create, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("manager", ["objects", "choices_objects"])
+def test_hydrate_models(benchmark, rows, manager: str):
+    qs = getattr(MyModel, manager).all()
+    assert len(benchmark(lambda: list(qs.all()))) == ROWS
+
+
+@pytest.mark.parametrize("manager", ["objects", "choices_objects"])
+def test_hydrate_values(benchmark, rows, manager: str):
+    qs = getattr(MyModel, manager).values()
+    assert len(benchmark(lambda: list(qs.all()))) == ROWS
+
+
+@pytest.mark.parametrize("manager", ["objects", "choices_objects"])
+def test_hydrate_values_list(benchmark, rows, manager: str):
+    qs = getattr(MyModel, manager).values_list("c_field", "i_field", "if_field")
+    assert len(benchmark(lambda: list(qs.all()))) == ROWS
+
+
+def test_update(benchmark, rows):
+    def update():
+        return MyModel.objects.update(
+            c_field=MyModel.TextEnum.C_FOO,
+            i_field=MyModel.IntegerEnum.I_FOO,
+        )
+
+    assert benchmark(update) == ROWS
@@ -1,7 +1,8 @@
-from .fields import IntegerChoicesField, TextChoicesField
+from .fields import CompactTextChoicesField, IntegerChoicesField, TextChoicesField
 from .types import IntegerChoicesFlag
 
 __all__ = [
+    "CompactTextChoicesField",
     "IntegerChoicesField",
     "IntegerChoicesFlag",
     "TextChoicesField",
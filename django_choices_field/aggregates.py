@@ -0,0 +1,61 @@
+from typing import Any
+
+from django.db import models
+
+from .fields import IntegerChoicesFlagField
+from .types import IntegerChoicesFlag
+
+
+class FlagCount(models.Sum):
+    """Count the rows of an IntegerChoicesFlagField that have any of the given flags set.
+
+    Compiles to `SUM(CASE WHEN (col & mask) <> 0 THEN 1 ELSE 0 END)`, so that counts
+    for several flags can be computed by the same query. Rows where the column is
+    `NULL` are not counted, and an empty queryset counts as 0.
+
+    Usage:
+        MyModel.objects.aggregate(foo=FlagCount("flags", Flags.FOO))
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        flags: int,
+        *,
+        filter: models.Q | None = None,  # noqa: A002
+        **extra: Any,
+    ):
+        super().__init__(
+            models.Case(
+                models.When(models.Q(**{f"{field_name}__has_any": flags}), then=1),
+                default=0,
+            ),
+            filter=filter,
+            default=0,
+            output_field=models.IntegerField(),
+            **extra,
+        )
+
+
+def get_flag_counts(
+    queryset: models.QuerySet,
+    field_name: str,
+) -> dict[IntegerChoicesFlag, int]:
+    """Return how many rows of `queryset` have each flag of an IntegerChoicesFlagField set.
+
+    All the counts are computed by a single query, with a `FlagCount` aggregate per
+    member of the field's `choices_enum`, and returned keyed by those members.
+
+    Usage:
+        counts = get_flag_counts(MyModel.objects.filter(...), "flags")
+        counts[Flags.FOO]
+    """
+    field = queryset.model._meta.get_field(field_name)  # noqa: SLF001
+    if not isinstance(field, IntegerChoicesFlagField):
+        raise TypeError(f"{field_name} is not an IntegerChoicesFlagField")
+
+    aliases = {f"_{field_name}_flag_{member.value}": member for member in field.choices_enum}
+    result = queryset.aggregate(
+        **{alias: FlagCount(field_name, member.value) for alias, member in aliases.items()},
+    )
+    return {member: result[alias] for alias, member in aliases.items()}
@@ -0,0 +1,416 @@
+import enum
+import functools
+import itertools
+import logging
+import operator
+import pickle
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, ClassVar, TypeAlias, cast
+
+from django.core.signals import setting_changed
+from django.db import models
+from django.utils.autoreload import file_changed
+from django.utils.translation import get_language
+from typing_extensions import Self
+
+from .types import IntegerChoicesFlag
+
+logger = logging.getLogger(__name__)
+
+try:
+    from django.utils.choices import BaseChoiceIterator
+except ImportError:  # pragma: nocover
+
+    class BaseChoiceIterator:  # noqa: PLW1641
+        """Base class for lazy iterators for choices (backport from Django 5.0)."""
+
+        def __eq__(self, other):
+            if isinstance(other, Iterable):
+                return all(
+                    a == b for a, b in itertools.zip_longest(self, other, fillvalue=object())
+                )
+            return super().__eq__(other)
+
+        def __getitem__(self, index):
+            if isinstance(index, slice) or index < 0:
+                return list(self)[index]
+            try:
+                return next(itertools.islice(self, index, index + 1))
+            except StopIteration:
+                raise IndexError("index out of range") from None
+
+        def __iter__(self):
+            raise NotImplementedError("BaseChoiceIterator subclasses must implement __iter__().")
+
+
+def _get_flag_description(descs: Sequence[str]) -> str:
+    return "|".join(str(desc) for desc in descs)
+
+
+_TranslatedDescriptions: TypeAlias = (
+    "weakref.WeakKeyDictionary[type[models.Choices], dict[tuple[int, str | None], str]]"
+)
+
+# Descriptions of flag combinations with lazy labels, keyed weakly by the enum and
+# then by the value and the language they were translated to.
+_translated_descriptions: _TranslatedDescriptions = weakref.WeakKeyDictionary()
+
+
+def _get_translated_flag_description(
+    choices_enum: "weakref.ref[type[models.Choices]]",
+    value: int,
+    descs: Sequence[str],
+) -> str:
+    enum_cls = choices_enum()
+    if enum_cls is None:
+        return _get_flag_description(descs)
+
+    try:
+        by_language = _translated_descriptions[enum_cls]
+    except KeyError:
+        by_language = _translated_descriptions.setdefault(enum_cls, {})
+
+    key = (value, get_language())
+    try:
+        return by_language[key]
+    except KeyError:
+        desc = by_language[key] = _get_flag_description(descs)
+        return desc
+
+
+try:
+    from django.utils.functional import Promise, lazy
+except ImportError:  # pragma: nocover
+    Promise = None
+    _get_flag_description_lazy = None
+    _get_translated_flag_description_lazy = None
+else:
+    _get_flag_description_lazy = cast(
+        "Callable[[Sequence[str]], str]",
+        lazy(_get_flag_description, str),
+    )
+    _get_translated_flag_description_lazy = cast(
+        "Callable[[weakref.ref[type[models.Choices]], int, Sequence[str]], str]",
+        lazy(_get_translated_flag_description, str),
+    )
+
+
+def get_flag_description(descs: Sequence[str]) -> str:
+    """Join the labels of the members that compose a flag value.
+
+    A lazy string is returned when any of the labels is lazy (e.g. `gettext_lazy`),
+    so that the description is translated when rendered.
+    """
+    if Promise is not None and any(isinstance(desc, Promise) for desc in descs):
+        assert _get_flag_description_lazy is not None
+        return _get_flag_description_lazy(descs)
+
+    return _get_flag_description(descs)
+
+
+def clear_translated_descriptions():
+    """Clear the cached translations of flag descriptions.
+
+    This is done automatically when the translation settings change or when the
+    autoreloader reloads the translation files.
+    """
+    _translated_descriptions.clear()
+
+
+def _translation_settings_changed(*, setting, **kwargs):
+    if setting in {"LANGUAGES", "LANGUAGE_CODE", "LOCALE_PATHS"}:
+        clear_translated_descriptions()
+
+
+def _translation_file_changed(*, file_path, **kwargs):
+    if file_path.suffix == ".mo":
+        clear_translated_descriptions()
+
+
+setting_changed.connect(_translation_settings_changed)
+file_changed.connect(_translation_file_changed)
+
+
+class EnumChoices(BaseChoiceIterator):
+    """Immutable choices for a Choices enum.
+
+    Use `EnumChoices.for_enum` to get them, so that every field using the same enum
+    shares a single instance instead of building its own list of choices. Only a
+    weak reference to the enum is kept, meaning that the shared instances don't
+    keep enums created at runtime alive.
+    """
+
+    def __init__(self, choices_enum: type[models.Choices], *, null: bool = False):
+        self._choices_enum = weakref.ref(choices_enum)
+        self._enum_name = choices_enum.__qualname__
+        self.null = null
+
+        self._choices: tuple[tuple[Any, Any], ...] = tuple(
+            (k, v) for (k, v) in choices_enum.choices if null or cast("object", k) is not None
+        )
+
+    @classmethod
+    def for_enum(cls, choices_enum: type[models.Choices], *, null: bool = False) -> Self:
+        """Return the choices shared by all fields using `choices_enum`."""
+        try:
+            by_kind = _shared_choices[choices_enum]
+        except KeyError:
+            by_kind = _shared_choices.setdefault(choices_enum, {})
+
+        try:
+            return cast("Self", by_kind[cls, null])
+        except KeyError:
+            return cast("Self", by_kind.setdefault((cls, null), cls(choices_enum, null=null)))
+
+    @property
+    def choices_enum(self) -> type[models.Choices] | None:
+        return self._choices_enum()
+
+    def __reduce__(self):
+        # The weak reference can't be pickled, so unpickling gets the shared
+        # choices for the enum instead
+        choices_enum = self._choices_enum()
+        if choices_enum is None:
+            raise pickle.PicklingError(f"Can't pickle {self!r}: its enum no longer exists")
+        return _get_shared_choices, (type(self), choices_enum, self.null)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self._enum_name}>"
+
+    def __len__(self):
+        return len(self._choices)
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        return iter(self._choices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._choices[index])
+        return self._choices[index]
+
+
+_SharedChoices: TypeAlias = (
+    "weakref.WeakKeyDictionary[type[models.Choices], dict[tuple[type, bool], EnumChoices]]"
+)
+
+# Keyed weakly on the enum, and then on the choices class and null
+_shared_choices: _SharedChoices = weakref.WeakKeyDictionary()
+
+
+def _get_shared_choices(
+    cls: type[EnumChoices],
+    choices_enum: type[models.Choices],
+    null: bool,
+) -> EnumChoices:
+    return cls.for_enum(choices_enum, null=null)
+
+
+class FlagChoices(EnumChoices):
+    """Lazy choices for an IntegerChoicesFlag enum.
+
+    Iterating over it yields the enum's own choices followed by every combination
+    of its members, the same way as an expanded list of choices would. Nothing is
+    built until then though, and looking up a single value with `in` or `get`
+    only decomposes that value into its members, meaning that the cost grows with
+    the number of members instead of the number of possible combinations.
+
+    The decomposition of a value and its description are kept in an LRU cache of up
+    to `cache_size` values, so rendering the same combinations over and over (e.g.
+    `get_FOO_display` in a list view) only costs a cache hit.
+    """
+
+    cache_size: ClassVar[int] = 4096
+
+    def __init__(self, choices_enum: type[IntegerChoicesFlag], *, null: bool = False):
+        super().__init__(choices_enum, null=null)
+
+        self._labels: dict[int | None, Any] = dict(self._choices)
+        self._members = tuple((x.value, x.label) for x in choices_enum)
+        self._mask = functools.reduce(operator.or_, (value for value, _ in self._members), 0)
+        self._get_combination = functools.lru_cache(maxsize=self.cache_size)(
+            self._build_combination,
+        )
+        self._flatchoices: tuple[tuple[int | None, Any], ...] | None = None
+
+    def __len__(self):
+        members_length = len(self._members)
+        return len(self._choices) + 2**members_length - members_length - 1
+
+    def __iter__(self) -> Iterator[tuple[int | None, Any]]:
+        yield from self._choices
+
+        # Go through the cache only when all the combinations fit in it, otherwise
+        # iterating would just evict everything else from it.
+        use_cache = len(self) - len(self._choices) <= self.cache_size
+        for i in range(2, len(self._members) + 1):
+            for combination in itertools.combinations(self._members, i):
+                value = functools.reduce(lambda a, b: a | b[0], combination, 0)
+                if use_cache:
+                    yield value, cast("tuple", self._get_combination(value))[1]
+                else:
+                    yield value, self._describe(value, combination)
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and 0 <= index < len(self._choices):
+            return self._choices[index]
+        return BaseChoiceIterator.__getitem__(self, index)
+
+    @property
+    def flatchoices(self) -> tuple[tuple[int | None, Any], ...]:
+        """All the choices, expanded, for the fields' `flatchoices`.
+
+        Like the labels, the expansion is only kept (and shared by every field using
+        the choices) when all the combinations fit in `cache_size`. Larger enums are
+        expanded again on each access, so that memory still only grows with the
+        number of members.
+        """
+        if self._flatchoices is not None:
+            return self._flatchoices
+
+        flatchoices = tuple(self)
+        if len(flatchoices) - len(self._choices) <= self.cache_size:
+            self._flatchoices = flatchoices
+        return flatchoices
+
+    def __contains__(self, value: object):
+        try:
+            if value in self._labels:
+                return True
+        except TypeError:
+            return False
+
+        return self.decompose(value) is not None
+
+    def _build_combination(self, value: int) -> tuple[tuple[int, ...], Any] | None:
+        if value <= 0 or value & ~self._mask:
+            return None
+
+        combination = tuple(m for m in self._members if m[0] & value == m[0])
+        if functools.reduce(lambda a, b: a | b[0], combination, 0) != value:
+            return None
+
+        return tuple(c[0] for c in combination), self._describe(value, combination)
+
+    def _describe(self, value: int, combination: Sequence[tuple[int, Any]]) -> str:
+        descs = [c[1] for c in combination]
+        if Promise is not None and any(isinstance(desc, Promise) for desc in descs):
+            # Translated once per language, instead of every time it is rendered
+            assert _get_translated_flag_description_lazy is not None
+            return _get_translated_flag_description_lazy(self._choices_enum, value, descs)
+
+        return _get_flag_description(descs)
+
+    def decompose(self, value: object) -> tuple[int, ...] | None:
+        """Return the values of the members that compose `value`.
+
+        `None` is returned when `value` is not a valid combination of the members.
+        """
+        if not isinstance(value, int):
+            return None
+
+        combination = self._get_combination(int(value))
+        return None if combination is None else combination[0]
+
+    def get(self, value: object, default: Any = None) -> Any:
+        """Return the label for the given value, or `default` if it is not a choice."""
+        try:
+            return self._labels[cast("int | None", value)]
+        except (KeyError, TypeError):
+            pass
+
+        if not isinstance(value, int):
+            return default
+
+        combination = self._get_combination(int(value))
+        return default if combination is None else combination[1]
+
+
+class MemberLookup:
+    """Constant-time lookup of enum members by their raw value.
+
+    The mapping is built once from the enum's members (including aliases), so
+    resolving an already known value costs a single dict lookup instead of going
+    through `EnumMeta.__call__`. A custom `members` mapping can be given instead,
+    to resolve members from something other than their values (e.g. stored codes).
+
+    Values that are not in the mapping fall back to calling the enum itself, which
+    raises `ValueError` for invalid values. Valid values resolved that way (e.g.
+    flag combinations, which the enum creates on demand) are then added to the
+    mapping, so they only pay that cost once.
+    """
+
+    __slots__ = ("_members", "choices_enum")
+
+    def __init__(
+        self,
+        choices_enum: type[enum.Enum],
+        members: Mapping[Any, enum.Enum] | None = None,
+    ):
+        self.choices_enum = choices_enum
+        self._members: dict[Any, enum.Enum] = (
+            dict(members)
+            if members is not None
+            else {member.value: member for member in choices_enum.__members__.values()}
+        )
+
+    def __call__(self, value: Any) -> Any:
+        try:
+            return self._members[value]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values can't be cached, let the enum deal with them
+            return self.choices_enum(value)
+
+        member = self.choices_enum(value)
+        self._members[value] = member
+        return member
+
+    def find(self, value: Any) -> Any:
+        """Return the member for an already known value, or `None` otherwise.
+
+        Unlike calling the lookup, this never goes through the enum itself.
+        """
+        return self._members.get(value)
+
+    def reject(self, count: int) -> None:
+        """Record that `count` values were rejected as invalid without raising.
+
+        Does nothing by itself; it's a hook for the instrumentation, for the batch
+        validation, which reports invalid values instead of raising for them.
+        """
+
+    def get(self, value: Any) -> Any:
+        """Resolve a value without raising for invalid ones.
+
+        `None` is returned as is, and so are values that are not valid for the
+        enum, which get logged as a warning instead.
+        """
+        try:
+            return self._members[value]
+        except KeyError:
+            pass
+
+        if value is None:
+            return None
+
+        try:
+            return self(value)
+        except ValueError:
+            logger.warning("%r is not a valid %s", value, self.choices_enum.__qualname__)
+            return value
+
+    def map(self, values: Sequence[Any], fallback: Callable[[Any], Any]) -> list[Any]:
+        """Resolve a batch of values at once.
+
+        Values that are not in the mapping (including `None`) are resolved by
+        calling `fallback` with them instead.
+        """
+        result = list(map(self._members.get, values))
+        if None in result:
+            for i, member in enumerate(result):
+                if member is None:
+                    result[i] = fallback(values[i])
+
+        return result
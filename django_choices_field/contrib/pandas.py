@@ -0,0 +1,104 @@
+"""Vectorized conversion of raw choices columns into pandas objects.
+
+Requires pandas to be installed, e.g. with `pip install django-choices-field[pandas]`.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import models
+from django.utils.encoding import force_str
+
+from django_choices_field.choices import FlagChoices
+from django_choices_field.fields import (
+    CompactTextChoicesField,
+    IntegerChoicesField,
+    IntegerChoicesFlagField,
+    TextChoicesField,
+)
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as e:  # pragma: nocover
+    raise ImportError(
+        "django_choices_field.contrib.pandas requires pandas to be installed",
+    ) from e
+
+ChoicesField = TextChoicesField | CompactTextChoicesField | IntegerChoicesField
+
+
+def _get_member_values(field: ChoicesField, members: list[models.Choices]) -> list[Any]:
+    if isinstance(field, CompactTextChoicesField):
+        return [field.codes[member.value] for member in members]
+    return [member.value for member in members]
+
+
+def to_categorical(
+    field: ChoicesField | IntegerChoicesFlagField,
+    values: Iterable[Any],
+) -> "pd.Categorical":
+    """Convert the raw values of a choices column into a Categorical of their labels.
+
+    `values` are the values as stored in the database (the codes, for
+    CompactTextChoicesField), or the enum members themselves for the other fields.
+    `NULL` and values that are not valid for the field's enum become missing values.
+
+    The categories are the labels of the enum's members, in their declaration order.
+    For IntegerChoicesFlagField they are the descriptions of the combinations found
+    in `values` instead, ordered by their value.
+    """
+    if isinstance(field, IntegerChoicesFlagField):
+        return _flags_to_categorical(field, values)
+
+    members = list(field.choices_enum)
+    codes = pd.Index(_get_member_values(field, members)).get_indexer(_to_array(values))
+    return pd.Categorical.from_codes(
+        codes,
+        categories=[force_str(member.label) for member in members],
+    )
+
+
+def _flags_to_categorical(field: IntegerChoicesFlagField, values: Iterable[Any]):
+    codes, uniques = pd.factorize(pd.array(_to_array(values), dtype="Int64"), sort=True)
+
+    choices = field.choices
+    if not isinstance(choices, FlagChoices):
+        choices = FlagChoices.for_enum(field.choices_enum)
+    labels = [choices.get(int(value)) for value in uniques]
+
+    # Combinations that are not valid for the enum are mapped to the -1 (missing)
+    # code, which is also what the extra last item of the mapping holds.
+    valid = [i for i, label in enumerate(labels) if label is not None]
+    mapping = np.full(len(labels) + 1, -1, dtype=np.intp)
+    mapping[valid] = np.arange(len(valid))
+
+    return pd.Categorical.from_codes(
+        mapping[codes],
+        categories=[force_str(labels[i]) for i in valid],
+    )
+
+
+def decompose_flags(field: IntegerChoicesFlagField, values: Iterable[Any]) -> "pd.DataFrame":
+    """Decompose the raw values of a flags column into one boolean column per flag.
+
+    The columns are named after the enum's members and hold whether each value has
+    that flag set. `NULL` values are missing in every column.
+    """
+    array = pd.array(_to_array(values), dtype="Int64")
+    mask = np.asarray(array.isna())
+    data = array.to_numpy(dtype=np.int64, na_value=0)
+
+    return pd.DataFrame(
+        {
+            member.name: pd.arrays.BooleanArray((data & member.value) == member.value, mask)
+            for member in field.choices_enum
+        },
+        index=values.index if isinstance(values, pd.Series) else None,
+    )
+
+
+def _to_array(values: Iterable[Any]) -> Any:
+    if isinstance(values, (pd.Series, pd.Index, np.ndarray, pd.api.extensions.ExtensionArray)):
+        return values
+    return np.asarray(list(values), dtype=object)
@@ -0,0 +1,95 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.encoding import force_str
+
+from .choices import FlagChoices
+from .fields import (
+    CompactTextChoicesField,
+    IntegerChoicesFlagField,
+    TextChoicesField,
+)
+from .query import _CHOICES_FIELDS, _ChoicesField
+
+
+def _get_label_resolver(field: _ChoicesField) -> Callable[[Any], Any]:
+    if isinstance(field, CompactTextChoicesField):
+        labels = {field.codes[m.value]: force_str(m.label) for m in field.choices_enum}
+    else:
+        labels = {m.value: force_str(m.label) for m in field.choices_enum}
+
+    flag_choices = None
+    if isinstance(field, IntegerChoicesFlagField):
+        flag_choices = (
+            field.choices
+            if isinstance(field.choices, FlagChoices)
+            else FlagChoices.for_enum(field.choices_enum)
+        )
+
+    def resolve(value):
+        try:
+            return labels[value]
+        except KeyError:
+            pass
+
+        if value is None or flag_choices is None:
+            return value
+
+        # Only valid combinations are cached, so the table can't grow past the number
+        # of combinations the enum has.
+        label = flag_choices.get(value)
+        if label is None:
+            return value
+
+        labels[value] = label = force_str(label)
+        return label
+
+    return resolve
+
+
+def iter_labels(
+    queryset: models.QuerySet,
+    *fields: str,
+    chunk_size: int = 2000,
+) -> Iterator[tuple[Any, ...]]:
+    """Iterate over the rows of a queryset with the labels of its choices fields.
+
+    Yields a tuple per row with the values of `fields`, like `.values_list(*fields)`
+    would, except that the values of the choices fields are replaced by the labels
+    of their members (the `"A|B"` descriptions for flag combinations). Values that
+    are not valid for the field's enum are yielded as is.
+
+    The rows are fetched with `.iterator(chunk_size=chunk_size)` and the raw column
+    values are resolved through a table built once per field, without creating
+    models or enum members, so that exporting large tables uses constant memory.
+    """
+    columns: list[Any] = []
+    resolvers: list[Callable[[Any], Any] | None] = []
+    for name in fields:
+        try:
+            field = queryset.model._meta.get_field(name)  # noqa: SLF001
+        except FieldDoesNotExist:
+            field = None
+
+        if isinstance(field, _CHOICES_FIELDS):
+            # Select the column as a plain value, skipping the field's from_db_value
+            output_field = (
+                models.CharField() if isinstance(field, TextChoicesField) else models.IntegerField()
+            )
+            columns.append(models.ExpressionWrapper(models.F(name), output_field=output_field))
+            resolvers.append(_get_label_resolver(field))
+        else:
+            columns.append(name)
+            resolvers.append(None)
+
+    if not any(resolvers):
+        yield from queryset.values_list(*columns).iterator(chunk_size=chunk_size)
+        return
+
+    for row in queryset.values_list(*columns).iterator(chunk_size=chunk_size):
+        yield tuple(
+            value if resolve is None else resolve(value)
+            for value, resolve in zip(row, resolvers, strict=True)
+        )
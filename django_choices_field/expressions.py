@@ -0,0 +1,229 @@
+import abc
+import enum
+import functools
+import operator
+from collections.abc import Iterable
+from typing import Any, ClassVar
+
+from django.db import models
+from django.db.models.expressions import CombinedExpression
+from django.db.models.lookups import Exact, IsNull
+from django.utils.encoding import force_str
+
+from .fields import IntegerChoicesFlagField
+from .query import _CHOICES_FIELDS
+
+
+class _FieldExpression(models.Expression):
+    def __init__(self, field_name: str):
+        super().__init__()
+        self.field_name = field_name
+
+    def _resolve_column(self, *args, **kwargs):
+        return models.F(self.field_name).resolve_expression(*args, **kwargs)
+
+
+class _FlagUpdate(_FieldExpression):
+    connector: ClassVar[str]
+
+    def __init__(self, field_name: str, flags: int):
+        super().__init__(field_name)
+        self.flags = flags
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field_name!r}, {self.flags!r})"
+
+    def get_operand(self, flags: int) -> int:
+        return flags
+
+    def resolve_expression(
+        self,
+        query=None,
+        allow_joins=True,
+        reuse=None,
+        summarize=False,
+        for_save=False,
+    ):
+        lhs = self._resolve_column(query, allow_joins, reuse, summarize, for_save)
+        field = lhs.output_field
+        if not isinstance(field, IntegerChoicesFlagField):
+            raise TypeError(f"{self.field_name} is not an IntegerChoicesFlagField")
+
+        choices_enum = field.choices_enum
+        if isinstance(self.flags, enum.Enum) and not isinstance(self.flags, choices_enum):
+            raise TypeError(f"{self.flags!r} is not a member of {choices_enum.__qualname__}")
+
+        mask = functools.reduce(operator.or_, (m.value for m in choices_enum), 0)
+        if not isinstance(self.flags, int) or self.flags & ~mask:
+            raise ValueError(f"{self.flags!r} is not a valid {choices_enum.__qualname__}")
+
+        expression = CombinedExpression(
+            lhs,
+            self.connector,
+            models.Value(self.get_operand(int(self.flags))),
+            output_field=field,
+        )
+        return expression.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+
+class FlagSet(_FlagUpdate):
+    """Set the given flags of an IntegerChoicesFlagField (`col | flags`).
+
+    The flags are checked against the field's `choices_enum` when the expression is
+    resolved. Rows where the column is `NULL` are left as `NULL`.
+
+    Usage:
+        MyModel.objects.filter(...).update(flags=FlagSet("flags", Flags.FOO))
+    """
+
+    connector = models.Expression.BITOR
+
+
+class FlagClear(_FlagUpdate):
+    """Clear the given flags of an IntegerChoicesFlagField (`col & ~flags`).
+
+    The flags are checked against the field's `choices_enum` when the expression is
+    resolved. Rows where the column is `NULL` are left as `NULL`.
+
+    Usage:
+        MyModel.objects.filter(...).update(flags=FlagClear("flags", Flags.FOO))
+    """
+
+    connector = models.Expression.BITAND
+
+    def get_operand(self, flags):
+        # Inverted in Python, since not all databases have a bitwise NOT operator
+        return ~flags
+
+
+class FlagToggle(_FlagUpdate):
+    """Toggle the given flags of an IntegerChoicesFlagField (`col # flags`).
+
+    Compiles to the XOR operator of each database (`#` on PostgreSQL, `^` on MySQL
+    and a function on SQLite). The flags are checked against the field's
+    `choices_enum` when the expression is resolved. Rows where the column is `NULL`
+    are left as `NULL`.
+
+    Usage:
+        MyModel.objects.filter(...).update(flags=FlagToggle("flags", Flags.FOO))
+    """
+
+    connector = models.Expression.BITXOR
+
+
+class _Literal(models.Value):
+    # Values from the enum are trusted, so they are inlined in the SQL instead of
+    # passed as parameters. That way the database can match the expression against
+    # functional indexes on it, which is the same reason the flag lookups do it.
+    def as_sql(self, compiler, connection):
+        if isinstance(self.value, int):
+            return str(int(self.value)), ()
+        if isinstance(self.value, str):
+            # The SQL is interpolated with the parameters, which turns %% back into %.
+            # Schema statements (e.g. an index on the expression), which Django compiles
+            # without column aliases, are interpolated twice: once when the statement is
+            # built, and again when it is executed.
+            quoted = connection.schema_editor().quote_value(self.value)
+            return quoted.replace("%", "%%" if compiler.query.alias_cols else "%%%%"), ()
+        return super().as_sql(compiler, connection)
+
+
+class _ChoicesCase(_FieldExpression, abc.ABC):
+    invalid_field_message: ClassVar[str]
+
+    def __init__(self, field_name: str, *, default: Any = None):
+        super().__init__(field_name)
+        self.default = default
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field_name!r})"
+
+    @abc.abstractmethod
+    def get_cases(self, choices_enum: type[models.Choices]) -> Iterable[tuple[Any, Any]]:
+        """Return the value and result of each `WHEN` of the `CASE`."""
+
+    def get_default(self) -> models.Value:
+        return models.Value(self.default)
+
+    def resolve_expression(
+        self,
+        query=None,
+        allow_joins=True,
+        reuse=None,
+        summarize=False,
+        for_save=False,
+    ):
+        column = self._resolve_column(query, allow_joins, reuse, summarize, for_save)
+        field = column.output_field
+        if not isinstance(field, _CHOICES_FIELDS) or isinstance(field, IntegerChoicesFlagField):
+            raise TypeError(self.invalid_field_message.format(field_name=self.field_name))
+
+        whens = [
+            models.When(
+                IsNull(column, True)
+                if value is None
+                else Exact(column, _Literal(field.get_prep_value(value))),
+                then=result,
+            )
+            for value, result in self.get_cases(field.choices_enum)
+        ]
+        expression = models.Case(
+            *whens,
+            default=self.get_default(),
+            output_field=self.output_field,
+        )
+        return expression.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+
+class ChoiceLabel(_ChoicesCase):
+    """The label of the value of a choices field, in the active language.
+
+    Compiles to a `CASE` mapping each value of the field's `choices_enum` to its
+    label, so that `order_by()`, `values()` and `annotate()` can use the labels in
+    the database. `NULL` gets the enum's `__empty__` label, if it has one. Other
+    values that are not part of the enum get `default`.
+
+    The labels are translated when the expression is resolved (e.g. by `annotate()`).
+    IntegerChoicesFlagField is not supported, since flag combinations don't have a
+    label of their own.
+
+    Usage:
+        MyModel.objects.annotate(status_label=ChoiceLabel("status")).order_by("status_label")
+    """
+
+    output_field = models.CharField()
+    invalid_field_message = "{field_name} is not a choices field with a label for each value"
+
+    def __init__(self, field_name: str, *, default: str | None = None):
+        super().__init__(field_name, default=default)
+
+    def get_cases(self, choices_enum):
+        return [(value, models.Value(force_str(label))) for value, label in choices_enum.choices]
+
+
+class ChoiceOrder(_ChoicesCase):
+    """The position of the value of a choices field in its enum's declaration order.
+
+    Compiles to a `CASE` mapping each member of the field's `choices_enum` to its
+    position, so that querysets can be ordered by it in the database, instead of
+    by the stored values themselves (e.g. alphabetically for TextChoicesField).
+    `NULL` and values that are not part of the enum get `default`.
+
+    The expression can also be indexed, with `models.Index(ChoiceOrder(...))`, which
+    lets ordered and sliced querysets read the rows in that order from the index.
+
+    Usage:
+        MyModel.objects.order_by(ChoiceOrder("status"), "pk")[:20]
+    """
+
+    output_field = models.IntegerField()
+    invalid_field_message = "{field_name} is not a choices field with a position for each value"
+
+    def __init__(self, field_name: str, *, default: int | None = None):
+        super().__init__(field_name, default=default)
+
+    def get_cases(self, choices_enum):
+        return [(member.value, _Literal(i)) for i, member in enumerate(choices_enum)]
+
+    def get_default(self):
+        return _Literal(self.default)
@@ -1,19 +1,52 @@
+import copy
+import enum
 import functools
 import itertools
-from collections.abc import Callable, Sequence
+import operator
+import weakref
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import cached_property, partialmethod
 from typing import (
+    Any,
     ClassVar,
+    NamedTuple,
+    TypeVar,
     cast,
 )
 
+from django.apps import apps
+from django.core import checks
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db import models
-
+from django.db.migrations.exceptions import BadMigrationError, NodeNotFoundError
+from django.db.models.fields import BLANK_CHOICE_DASH
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from django.utils.text import capfirst
+
+from .choices import EnumChoices, FlagChoices, MemberLookup
+from .forms import IntegerChoicesFlagFormField
+from .lookups import HasAll, HasAny, HasNone
+from .operations import get_migrated_enum_types
 from .types import IntegerChoicesFlag
 
+_E = TypeVar("_E", bound=models.Choices)
+
+# Like `choices`, the enum doesn't change the column, so altering it (e.g. the
+# migrations written before fields were deconstructed to their enum) doesn't touch
+# the database
+_NON_DB_ATTRS = (*models.Field.non_db_attrs, "choices_enum")
+
+# Upper bound of a PositiveSmallIntegerField that is safe on all backends
+_MAX_SMALLINT = 32767
 
-def _get_flag_description(descs: Sequence[str]) -> str:
-    return "|".join(str(desc) for desc in descs)
+# Integer column sizes, from the smallest to the largest, with their internal type
+# and the range of values that is safe on all backends
+_INTEGER_SIZES = {
+    "small": ("SmallIntegerField", -(2**15), 2**15 - 1),
+    "regular": ("IntegerField", -(2**31), 2**31 - 1),
+    "big": ("BigIntegerField", -(2**63), 2**63 - 1),
+}
 
 
 def _get_integer_enum_members(choices: list[tuple[int | None, str]]) -> dict[str, int]:
@@ -24,16 +57,187 @@ def _get_integer_enum_members(choices: list[tuple[int | None, str]]) -> dict[str
     return {desc.replace(" ", "_").upper(): value for value, desc in filtered_choices}
 
 
-try:
-    from django.utils.functional import Promise, lazy
-except ImportError:  # pragma: nocover
-    Promise = None
-    _get_flag_description_lazy = None
-else:
-    _get_flag_description_lazy = cast(
-        "Callable[[Sequence[str]], str]",
-        lazy(_get_flag_description, str),
-    )
+# Enums created from the same choices, shared by the fields using them for as long
+# as any of them is alive
+_shared_choices_enums: "weakref.WeakValueDictionary[tuple[Any, ...], type[models.Choices]]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _get_shared_choices_enum(
+    base: type[models.Choices],
+    members: tuple[tuple[str, Any], ...],
+) -> type[models.Choices]:
+    key = (base, members)
+    choices_enum = _shared_choices_enums.get(key)
+    if choices_enum is None:
+        choices_enum = _shared_choices_enums[key] = base("ChoicesEnum", list(members))
+    return choices_enum
+
+
+def _get_choices_enum(
+    base: type[_E],
+    members: Iterable[tuple[str, Any]],
+) -> type[_E]:
+    members = tuple(members)
+    # Lazy labels can only be compared by translating them, so enums using them
+    # are not shared.
+    if any(isinstance(value, tuple) and isinstance(value[-1], Promise) for _, value in members):
+        return base("ChoicesEnum", list(members))  # type: ignore[return-value]
+
+    return cast("type[_E]", _get_shared_choices_enum(base, members))
+
+
+def _get_integer_enum_values(field: models.Field) -> list[int]:
+    # Read from the choices when the enum hasn't been created yet, so that checking
+    # the integer size doesn't create it
+    if "choices_enum" in field.__dict__:
+        return [member.value for member in field.choices_enum]  # type: ignore[attr-defined]
+    return [value for _name, value in field._enum_members]  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+def _get_integer_size(
+    field: models.Field,
+    integer_size: str | None,
+    get_values: Callable[[], list[int]],
+) -> str | None:
+    if integer_size is None:
+        return None
+
+    values = get_values()
+    low, high = min(values, default=0), max(values, default=0)
+    if integer_size == "auto":
+        for size, (_internal_type, min_value, max_value) in _INTEGER_SIZES.items():
+            if min_value <= low and high <= max_value:
+                return size
+
+        raise ImproperlyConfigured(
+            f"{field.__class__.__name__} values range from {low} to {high}, "
+            f"which doesn't fit in any integer column.",
+        )
+
+    if integer_size not in _INTEGER_SIZES:
+        raise ImproperlyConfigured(
+            f"{field.__class__.__name__} integer_size must be one of: "
+            f"auto, {', '.join(_INTEGER_SIZES)}.",
+        )
+
+    _internal_type, min_value, max_value = _INTEGER_SIZES[integer_size]
+    if low < min_value or high > max_value:
+        raise ImproperlyConfigured(
+            f"{field.__class__.__name__} values range from {low} to {high}, "
+            f"which doesn't fit in a {integer_size} integer column.",
+        )
+
+    return integer_size
+
+
+def _deconstruct_choices(
+    field: models.Field,
+    field_class: type[models.Field],
+) -> tuple[str, str, list, dict]:
+    choices = field.choices
+    if not isinstance(choices, EnumChoices):
+        return super(field_class, field).deconstruct()
+
+    # Field.deconstruct() would expand the choices into a list, which for flags means
+    # every combination. Referencing the enum keeps migrations small and lets the
+    # autodetector compare the field by its import path. A copy is deconstructed so
+    # that the field itself, which may be in use by other threads, is never changed.
+    clone = copy.copy(field)
+    clone.choices = None
+    name, path, args, kwargs = super(field_class, clone).deconstruct()
+
+    kwargs["choices_enum"] = field.choices_enum  # type: ignore[attr-defined]
+    return name, path, args, kwargs
+
+
+class ValidatedValues(NamedTuple):
+    """The result of validating a batch of values with the fields' `validate_many`.
+
+    Invalid values are reported by their position, instead of raising a
+    `ValidationError` for each of them like calling `clean()` per value would.
+    """
+
+    #: The members the values were converted to, with `None` for empty and invalid values
+    members: list[Any]
+    #: The positions of the invalid values
+    invalid: list[int]
+
+
+# Marks invalid values while validating a batch
+_INVALID = object()
+
+
+def _coerce_int(value: Any) -> Any:
+    return int(value) if isinstance(value, str) else value
+
+
+def _validate_many(
+    field: "TextChoicesField | CompactTextChoicesField | IntegerChoicesField | IntegerChoicesFlagField",
+    values: Iterable[Any],
+    coerce: Callable[[Any], Any] | None = None,
+) -> ValidatedValues:
+    values = values if isinstance(values, Sequence) else list(values)
+    lookup = field._member_lookup  # noqa: SLF001
+    flag_choices = field.choices if isinstance(field.choices, FlagChoices) else None
+    # The same as Field.validate() does for empty values
+    allow_empty = field.null and field.blank
+
+    def resolve(value):
+        if value in field.empty_values:
+            return None if allow_empty else _INVALID
+
+        try:
+            if coerce is not None:
+                value = coerce(value)
+            member = lookup.find(value)
+            # Flag combinations are only added to the lookup once they are used
+            if member is None and flag_choices is not None and value in flag_choices:
+                member = lookup(value)
+        except (TypeError, ValueError):
+            return _INVALID
+
+        return _INVALID if member is None else member
+
+    try:
+        members = lookup.map(values, resolve)
+    except TypeError:
+        # Unhashable values, resolve each value on its own
+        members = [resolve(value) for value in values]
+
+    if flag_choices is not None:
+        # The lookup also caches values that the enum accepts but are not valid
+        # choices (e.g. 0, once it has been read from the database)
+        for i, member in enumerate(members):
+            if member is not None and member is not _INVALID and member not in flag_choices:
+                members[i] = _INVALID
+
+    # The default validators are satisfied by the enum's values by construction
+    if field._validators:  # noqa: SLF001
+        for i, member in enumerate(members):
+            if member is None or member is _INVALID:
+                continue
+            try:
+                field.run_validators(member)
+            except ValidationError:
+                members[i] = _INVALID
+
+    if _INVALID not in members:
+        return ValidatedValues(members, [])
+
+    invalid = [i for i, member in enumerate(members) if member is _INVALID]
+    for i in invalid:
+        members[i] = None
+    lookup.reject(len(invalid))
+    return ValidatedValues(members, invalid)
+
+
+def _get_flag_field_display(self: models.Model, field: "IntegerChoicesFlagField"):
+    value = getattr(self, field.attname)
+    choices = cast("FlagChoices", field.choices)
+    # force_str() to coerce lazy strings.
+    return force_str(choices.get(value, value), strings_only=True)
 
 
 class TextChoicesField(models.CharField):
@@ -44,6 +248,7 @@ class TextChoicesField(models.CharField):
     """
 
     description: ClassVar[str] = "TextChoices"
+    non_db_attrs: ClassVar[tuple[str, ...]] = _NON_DB_ATTRS
     default_error_messages: ClassVar[dict[str, str]] = {
         "invalid": "“%(value)s” must be a subclass of %(enum)s.",
     }
@@ -53,21 +258,21 @@ class TextChoicesField(models.CharField):
         choices_enum: type[models.TextChoices] | None = None,
         verbose_name: str | None = None,
         name: str | None = None,
+        *,
+        trusted_reads: bool = False,
+        db_enum_type: str | None = None,
         **kwargs,
     ):
+        self.trusted_reads = trusted_reads
+        self.db_enum_type = db_enum_type
         if choices_enum is not None:
             self.choices_enum = choices_enum
-            if getattr(self, "null", False) or kwargs.get("null"):
-                kwargs["choices"] = choices_enum.choices
-            else:
-                kwargs["choices"] = [
-                    (k, v) for (k, v) in choices_enum.choices if cast("object", k) is not None
-                ]
-        elif "choices" in kwargs:
-            self.choices_enum = models.TextChoices(
-                "ChoicesEnum",
-                [(k, (k, v)) for k, v in kwargs["choices"] if k is not None],
+            kwargs["choices"] = EnumChoices.for_enum(
+                choices_enum,
+                null=bool(getattr(self, "null", False) or kwargs.get("null")),
             )
+        elif "choices" in kwargs:
+            self._enum_members = [(k, (k, v)) for k, v in kwargs["choices"] if k is not None]
         else:
             raise TypeError("either of choices_enum or choices must be provided")
 
@@ -83,12 +288,67 @@ class TextChoicesField(models.CharField):
                 f"{self.__class__.__name__} with blank=True must also have null=True.",
             )
 
+    def deconstruct(self):
+        name, path, args, kwargs = _deconstruct_choices(self, TextChoicesField)
+        if self.trusted_reads:
+            kwargs["trusted_reads"] = True
+        if self.db_enum_type is not None:
+            kwargs["db_enum_type"] = self.db_enum_type
+        return name, path, args, kwargs
+
+    def _check_db_enum_type(self, migrated_enum_types: Mapping[str, set[str]]):
+        if self.db_enum_type is None:
+            return []
+
+        # The operations are written by hand, so check that they kept up with the enum
+        values = migrated_enum_types.get(self.db_enum_type)
+        if values is None:
+            return [
+                checks.Warning(
+                    f"The enum type {self.db_enum_type} is not created by any migration.",
+                    hint=f"Add a CreateEnumType({self.db_enum_type!r}, ...) migration operation.",
+                    obj=self,
+                    id="django_choices_field.W001",
+                ),
+            ]
+
+        missing = [member.value for member in self.choices_enum if member.value not in values]
+        if missing:
+            return [
+                checks.Warning(
+                    f"The enum type {self.db_enum_type} is missing values of "
+                    f"{self.choices_enum.__qualname__}: {', '.join(missing)}.",
+                    hint=f"Add an AlterEnumType({self.db_enum_type!r}, ...) migration operation.",
+                    obj=self,
+                    id="django_choices_field.W002",
+                ),
+            ]
+
+        return []
+
+    def db_type(self, connection):
+        # The enum type itself is managed by the CreateEnumType/AlterEnumType migration
+        # operations. Other databases keep using the varchar column.
+        if self.db_enum_type is not None and connection.vendor == "postgresql":
+            return connection.ops.quote_name(self.db_enum_type)
+        return super().db_type(connection)
+
+    @cached_property
+    def choices_enum(self) -> type[models.TextChoices]:
+        # Only created when first needed (for fields created from `choices`), since
+        # creating enums is expensive
+        return _get_choices_enum(models.TextChoices, self._enum_members)
+
+    @cached_property
+    def _member_lookup(self) -> MemberLookup:
+        return MemberLookup(self.choices_enum)
+
     def to_python(self, value):
         if value in self.empty_values:  # type: ignore[attr-defined]
             return None
 
         try:
-            return self.choices_enum(value)  # type: ignore[operator]
+            return self._member_lookup(value)
         except ValueError as e:
             raise ValidationError(
                 self.error_messages["invalid"],
@@ -97,11 +357,197 @@ class TextChoicesField(models.CharField):
             ) from e
 
     def from_db_value(self, value, expression, connection):
+        if self.trusted_reads:
+            return self._member_lookup.get(value)
         return self.to_python(value)
 
+    def from_db_values(self, values):
+        if self.trusted_reads:
+            return self._member_lookup.map(values, self._member_lookup.get)
+        return self._member_lookup.map(values, self.to_python)
+
+    def validate_many(self, values):
+        return _validate_many(self, values)
+
     def get_prep_value(self, value):
-        value = super().get_prep_value(value)
-        return self.to_python(value)
+        if isinstance(value, self.choices_enum):
+            return value.value
+
+        # CharField.get_prep_value would already call to_python
+        value = self.to_python(models.Field.get_prep_value(self, value))
+        return None if value is None else value.value
+
+
+@checks.register(checks.Tags.models)
+def _check_db_enum_types(app_configs=None, **kwargs):
+    # Loading the migrations imports all of them, so it is done once for all the
+    # fields, and only when some field uses an enum type
+    if app_configs is None:
+        all_models = apps.get_models()
+    else:
+        all_models = itertools.chain.from_iterable(c.get_models() for c in app_configs)
+    fields = [
+        field
+        for model in all_models
+        for field in model._meta.local_fields  # noqa: SLF001
+        if isinstance(field, TextChoicesField) and field.db_enum_type is not None
+    ]
+    if not fields:
+        return []
+
+    try:
+        migrated_enum_types = get_migrated_enum_types()
+    except (BadMigrationError, ImportError, NodeNotFoundError) as e:
+        return [
+            checks.Warning(
+                f"The migrations could not be loaded to check the enum types: {e}",
+                id="django_choices_field.W003",
+            ),
+        ]
+
+    return [error for field in fields for error in field._check_db_enum_type(migrated_enum_types)]  # noqa: SLF001
+
+
+class CompactTextChoicesField(models.PositiveSmallIntegerField):
+    """A PositiveSmallIntegerField that stores values from a TextChoices enum as codes.
+
+    Each member of the TextChoices enum is stored as the small integer code assigned
+    to it in `codes`, while still being exposed as the member itself in python. The
+    codes are part of the field's definition, meaning that they are recorded in
+    migrations and must be kept stable once data has been stored with them.
+    """
+
+    description: ClassVar[str] = "TextChoices"
+    non_db_attrs: ClassVar[tuple[str, ...]] = _NON_DB_ATTRS
+    default_error_messages: ClassVar[dict[str, str]] = {
+        "invalid": "“%(value)s” must be a subclass of %(enum)s.",
+    }
+
+    def __init__(
+        self,
+        choices_enum: type[models.TextChoices] | None = None,
+        verbose_name: str | None = None,
+        name: str | None = None,
+        *,
+        codes: Mapping[str, int] | None = None,
+        trusted_reads: bool = False,
+        **kwargs,
+    ):
+        self.trusted_reads = trusted_reads
+        if choices_enum is not None:
+            self.choices_enum = choices_enum
+            kwargs["choices"] = EnumChoices.for_enum(
+                choices_enum,
+                null=bool(getattr(self, "null", False) or kwargs.get("null")),
+            )
+        elif "choices" in kwargs:
+            self._enum_members = [(k, (k, v)) for k, v in kwargs["choices"] if k is not None]
+        else:
+            raise TypeError("either of choices_enum or choices must be provided")
+
+        if codes is None:
+            raise TypeError("codes must be provided")
+
+        self.codes = {
+            (k.value if isinstance(k, enum.Enum) else k): int(v) for k, v in codes.items()
+        }
+
+        super().__init__(verbose_name=verbose_name, name=name, **kwargs)
+
+        if self.blank and not self.null:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} with blank=True must also have null=True.",
+            )
+
+        values = {k for k, _v in self.choices if k is not None}
+        if missing := values - self.codes.keys():
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} is missing codes for: {', '.join(sorted(missing))}.",
+            )
+        if unknown := self.codes.keys() - values:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} has codes for unknown values: "
+                f"{', '.join(sorted(unknown))}.",
+            )
+        if len(set(self.codes.values())) != len(self.codes):
+            raise ImproperlyConfigured(f"{self.__class__.__name__} codes must be unique.")
+        if not all(0 <= code <= _MAX_SMALLINT for code in self.codes.values()):
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} codes must be between 0 and {_MAX_SMALLINT}.",
+            )
+
+    def deconstruct(self):
+        name, path, args, kwargs = _deconstruct_choices(self, CompactTextChoicesField)
+        kwargs["codes"] = self.codes
+        if self.trusted_reads:
+            kwargs["trusted_reads"] = True
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        # The integer range validators apply to the codes, not to the members
+        return [*self.default_validators, *self._validators]
+
+    @cached_property
+    def choices_enum(self) -> type[models.TextChoices]:
+        return _get_choices_enum(models.TextChoices, self._enum_members)
+
+    @cached_property
+    def _member_lookup(self) -> MemberLookup:
+        return MemberLookup(self.choices_enum)
+
+    @cached_property
+    def _code_lookup(self) -> MemberLookup:
+        return MemberLookup(
+            self.choices_enum,
+            {code: self.choices_enum(value) for value, code in self.codes.items()},
+        )
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+
+        try:
+            return self._member_lookup(value)
+        except ValueError as e:
+            raise ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"value": value, "enum": self.choices_enum},
+            ) from e
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        if self.trusted_reads:
+            return self._code_lookup.get(value)
+
+        try:
+            return self._code_lookup(value)
+        except ValueError as e:
+            raise ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"value": value, "enum": self.choices_enum},
+            ) from e
+
+    def from_db_values(self, values):
+        return self._code_lookup.map(
+            values,
+            lambda value: self.from_db_value(value, None, None),
+        )
+
+    def validate_many(self, values):
+        return _validate_many(self, values)
+
+    def get_prep_value(self, value):
+        if not isinstance(value, self.choices_enum):
+            # IntegerField.get_prep_value would try to convert the value to an int
+            value = self.to_python(models.Field.get_prep_value(self, value))
+            if value is None:
+                return None
+
+        return self.codes[value.value]
 
 
 class IntegerChoicesField(models.IntegerField):
@@ -112,6 +558,7 @@ class IntegerChoicesField(models.IntegerField):
     """
 
     description: ClassVar[str] = "IntegerChoices"
+    non_db_attrs: ClassVar[tuple[str, ...]] = _NON_DB_ATTRS
     default_error_messages: ClassVar[dict[str, str]] = {
         "invalid": "“%(value)s” must be a subclass of %(enum)s.",
     }
@@ -121,35 +568,64 @@ class IntegerChoicesField(models.IntegerField):
         choices_enum: type[models.IntegerChoices] | None = None,
         verbose_name: str | None = None,
         name: str | None = None,
+        *,
+        trusted_reads: bool = False,
+        integer_size: str | None = None,
         **kwargs,
     ):
+        self.trusted_reads = trusted_reads
         if choices_enum is not None:
             self.choices_enum = choices_enum
-            if getattr(self, "null", False) or kwargs.get("null"):
-                kwargs["choices"] = choices_enum.choices
-            else:
-                kwargs["choices"] = [
-                    (k, v) for (k, v) in choices_enum.choices if cast("object", k) is not None
-                ]
+            kwargs["choices"] = EnumChoices.for_enum(
+                choices_enum,
+                null=bool(getattr(self, "null", False) or kwargs.get("null")),
+            )
         elif "choices" in kwargs:
-            enum_members = _get_integer_enum_members(kwargs["choices"])
-            self.choices_enum = models.IntegerChoices("ChoicesEnum", enum_members)
+            self._enum_members = list(_get_integer_enum_members(kwargs["choices"]).items())
         else:
             raise TypeError("either of choices_enum or choices must be provided")
 
         super().__init__(verbose_name=verbose_name, name=name, **kwargs)
 
+        self.integer_size = _get_integer_size(
+            self,
+            integer_size,
+            lambda: _get_integer_enum_values(self),
+        )
+
         if self.blank and not self.null:
             raise ImproperlyConfigured(
                 f"{self.__class__.__name__} with blank=True must also have null=True.",
             )
 
+    def deconstruct(self):
+        name, path, args, kwargs = _deconstruct_choices(self, IntegerChoicesField)
+        if self.trusted_reads:
+            kwargs["trusted_reads"] = True
+        if self.integer_size is not None:
+            # "auto" is resolved so that migrations pick up when the size changes
+            kwargs["integer_size"] = self.integer_size
+        return name, path, args, kwargs
+
+    def get_internal_type(self):
+        if self.integer_size is None:
+            return super().get_internal_type()
+        return _INTEGER_SIZES[self.integer_size][0]
+
+    @cached_property
+    def choices_enum(self) -> type[models.IntegerChoices]:
+        return _get_choices_enum(models.IntegerChoices, self._enum_members)
+
+    @cached_property
+    def _member_lookup(self) -> MemberLookup:
+        return MemberLookup(self.choices_enum)
+
     def to_python(self, value):
         if value is None:
             return None
 
         try:
-            return self.choices_enum(int(value) if isinstance(value, str) else value)
+            return self._member_lookup(int(value) if isinstance(value, str) else value)
         except ValueError as e:
             raise ValidationError(
                 self.error_messages["invalid"],
@@ -158,11 +634,24 @@ class IntegerChoicesField(models.IntegerField):
             ) from e
 
     def from_db_value(self, value, expression, connection):
+        if self.trusted_reads:
+            return self._member_lookup.get(value)
         return self.to_python(value)
 
+    def from_db_values(self, values):
+        if self.trusted_reads:
+            return self._member_lookup.map(values, self._member_lookup.get)
+        return self._member_lookup.map(values, self.to_python)
+
+    def validate_many(self, values):
+        return _validate_many(self, values, coerce=_coerce_int)
+
     def get_prep_value(self, value):
-        value = super().get_prep_value(value)
-        return self.to_python(value)
+        if isinstance(value, self.choices_enum):
+            return value.value
+
+        value = self.to_python(super().get_prep_value(value))
+        return None if value is None else value.value
 
     def formfield(self, **kwargs):  # pragma:nocover
         return super().formfield(
@@ -181,6 +670,7 @@ class IntegerChoicesFlagField(models.IntegerField):
     """
 
     description: ClassVar[str] = "IntegerChoicesFlag"
+    non_db_attrs: ClassVar[tuple[str, ...]] = _NON_DB_ATTRS
     default_error_messages: ClassVar[dict[str, str]] = {
         "invalid": "“%(value)s” must be a subclass of %(enum)s.",
     }
@@ -190,55 +680,112 @@ class IntegerChoicesFlagField(models.IntegerField):
         choices_enum: type[IntegerChoicesFlag] | None = None,
         verbose_name: str | None = None,
         name: str | None = None,
+        *,
+        trusted_reads: bool = False,
+        integer_size: str | None = None,
         **kwargs,
     ):
+        self.trusted_reads = trusted_reads
         if choices_enum is not None:
             self.choices_enum = choices_enum
-
-            choices: list[tuple[int | None, str]]
-            if getattr(self, "null", False) or kwargs.get("null"):
-                choices = list(choices_enum.choices)
-            else:
-                choices = [
-                    (k, v) for (k, v) in choices_enum.choices if cast("object", k) is not None
-                ]
-
-            default_choices = [(x.value, x.label) for x in choices_enum]
-            for i in range(1, len(default_choices)):
-                for combination in itertools.combinations(default_choices, i + 1):
-                    value = functools.reduce(lambda a, b: a | b[0], combination, 0)
-
-                    descs = [c[1] for c in combination]
-                    if Promise is not None and any(isinstance(desc, Promise) for desc in descs):
-                        assert _get_flag_description_lazy is not None
-                        desc = _get_flag_description_lazy(descs)
-                    else:
-                        desc = _get_flag_description(descs)
-
-                    choices.append((value, desc))
-
-            kwargs["choices"] = choices
+            kwargs["choices"] = FlagChoices.for_enum(
+                choices_enum,
+                null=bool(getattr(self, "null", False) or kwargs.get("null")),
+            )
         elif "choices" in kwargs:
             default_choices_length = len(kwargs["choices"]).bit_length()
             default_choices = [kwargs["choices"][i] for i in range(default_choices_length)]
-            enum_members = _get_integer_enum_members(default_choices)
-            self.choices_enum = models.IntegerChoices("ChoicesEnum", enum_members)
+            self._enum_members = list(_get_integer_enum_members(default_choices).items())
         else:
             raise TypeError("either of choices_enum or choices must be provided")
 
         super().__init__(verbose_name=verbose_name, name=name, **kwargs)
 
+        self.integer_size = _get_integer_size(
+            self,
+            integer_size,
+            lambda: [
+                # All the flags combined are the largest value that can be stored
+                functools.reduce(operator.or_, _get_integer_enum_values(self), 0),
+                *_get_integer_enum_values(self),
+            ],
+        )
+
         if self.blank and not self.null:
             raise ImproperlyConfigured(
                 f"{self.__class__.__name__} with blank=True must also have null=True.",
             )
 
+    def contribute_to_class(self, cls, name, private_only=False):
+        display_name = f"get_{self.name or name}_display"
+        has_custom_display = display_name in cls.__dict__
+
+        super().contribute_to_class(cls, name, private_only=private_only)
+
+        # Django's default implementation builds a dict out of all the choices,
+        # which would expand every flag combination.
+        if isinstance(self.choices, FlagChoices) and not has_custom_display:
+            setattr(cls, display_name, partialmethod(_get_flag_field_display, field=self))
+
+    def _check_choices(self):
+        # Choices generated from the enum are valid by construction, and checking
+        # them would expand every flag combination.
+        if isinstance(self.choices, FlagChoices):
+            return []
+
+        return super()._check_choices()
+
+    def deconstruct(self):
+        name, path, args, kwargs = _deconstruct_choices(self, IntegerChoicesFlagField)
+        if self.trusted_reads:
+            kwargs["trusted_reads"] = True
+        if self.integer_size is not None:
+            # "auto" is resolved so that migrations pick up when the size changes
+            kwargs["integer_size"] = self.integer_size
+        return name, path, args, kwargs
+
+    def get_internal_type(self):
+        if self.integer_size is None:
+            return super().get_internal_type()
+        return _INTEGER_SIZES[self.integer_size][0]
+
+    def validate(self, value, model_instance):
+        if not isinstance(self.choices, FlagChoices):
+            super().validate(value, model_instance)
+            return
+
+        # Same as Field.validate, but checking the choice without iterating over
+        # every flag combination.
+        if not self.editable:
+            return
+
+        if value not in self.empty_values and value not in self.choices:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+        if value is None and not self.null:
+            raise ValidationError(self.error_messages["null"], code="null")
+
+        if not self.blank and value in self.empty_values:
+            raise ValidationError(self.error_messages["blank"], code="blank")
+
+    @cached_property
+    def choices_enum(self) -> type[models.IntegerChoices]:
+        return _get_choices_enum(models.IntegerChoices, self._enum_members)
+
+    @cached_property
+    def _member_lookup(self) -> MemberLookup:
+        return MemberLookup(self.choices_enum)
+
     def to_python(self, value):
         if value is None:
             return None
 
         try:
-            return self.choices_enum(int(value) if isinstance(value, str) else value)
+            return self._member_lookup(int(value) if isinstance(value, str) else value)
         except ValueError as e:
             raise ValidationError(
                 self.error_messages["invalid"],
@@ -247,16 +794,77 @@ class IntegerChoicesFlagField(models.IntegerField):
             ) from e
 
     def from_db_value(self, value, expression, connection):
+        if self.trusted_reads:
+            return self._member_lookup.get(value)
         return self.to_python(value)
 
+    def from_db_values(self, values):
+        if self.trusted_reads:
+            return self._member_lookup.map(values, self._member_lookup.get)
+        return self._member_lookup.map(values, self.to_python)
+
+    def validate_many(self, values):
+        return _validate_many(self, values, coerce=_coerce_int)
+
     def get_prep_value(self, value):
-        value = super().get_prep_value(value)
-        return self.to_python(value)
+        if isinstance(value, self.choices_enum):
+            return value.value
+
+        value = self.to_python(super().get_prep_value(value))
+        return None if value is None else value.value
+
+    @property
+    def flatchoices(self):
+        if not isinstance(self.choices, FlagChoices):
+            return super().flatchoices
+
+        # Shared by the fields using the same enum, when it is small enough to keep
+        return self.choices.flatchoices
+
+    def get_choices(self, include_blank=True, blank_choice=BLANK_CHOICE_DASH, *args, **kwargs):
+        if not isinstance(self.choices, FlagChoices):
+            return super().get_choices(include_blank, blank_choice, *args, **kwargs)
+
+        # Only the flags themselves can be picked in forms (e.g. the admin builds the
+        # choices before calling formfield()), and the stock implementation would
+        # expand every combination of them
+        choices = [(member.value, member.label) for member in self.choices_enum]
+        return [*blank_choice, *choices] if include_blank else choices
+
+    def formfield(self, **kwargs):
+        if not isinstance(self.choices, FlagChoices):
+            return super().formfield(
+                **{
+                    "coerce": self.to_python,
+                    **kwargs,
+                },
+            )
 
-    def formfield(self, **kwargs):  # pragma:nocover
-        return super().formfield(
-            **{
-                "coerce": self.to_python,
-                **kwargs,
-            },
+        # A checkbox per flag, instead of a select with every combination of them
+        defaults: dict[str, Any] = {
+            "required": not self.blank,
+            "label": capfirst(self.verbose_name),
+            "help_text": self.help_text,
+            "choices_enum": self.choices_enum,
+        }
+        if self.has_default():
+            if callable(self.default):
+                defaults["initial"] = self.default
+                defaults["show_hidden_initial"] = True
+            else:
+                defaults["initial"] = self.get_default()
+
+        # The choices and their coercion are handled by the form field itself
+        for key in ("choices", "coerce", "empty_value", "max_value", "min_value"):
+            kwargs.pop(key, None)
+        form_class = (
+            kwargs.pop("choices_form_class", None)
+            or kwargs.pop("form_class", None)
+            or IntegerChoicesFlagFormField
         )
+        return form_class(**{**defaults, **kwargs})
+
+
+IntegerChoicesFlagField.register_lookup(HasAll)
+IntegerChoicesFlagField.register_lookup(HasAny)
+IntegerChoicesFlagField.register_lookup(HasNone)
@@ -1,8 +1,9 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import (
     Any,
     Generic,
     Literal,
+    NamedTuple,
     TypeAlias,
     TypeVar,
     overload,
@@ -18,10 +19,18 @@ StrOrPromise: TypeAlias = str | Promise
 _ValidatorCallable: TypeAlias = Callable[..., None]
 _ErrorMessagesToOverride: TypeAlias = dict[str, Any]
 
+class ValidatedValues(NamedTuple):
+    members: list[Any]
+    invalid: list[int]
+
 _C = TypeVar("_C", bound=TextChoices | None)
 
 class TextChoicesField(Field[_C, _C], Generic[_C]):
     choices_enum: type[_C]
+    trusted_reads: bool
+    db_enum_type: str | None
+    def from_db_values(self, values: Sequence[Any]) -> list[_C]: ...
+    def validate_many(self, values: Iterable[Any]) -> ValidatedValues: ...
     @overload
     def __new__(
         cls,
@@ -51,6 +60,9 @@ class TextChoicesField(Field[_C, _C], Generic[_C]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        db_enum_type: str | None = ...,
     ) -> TextChoicesField[_C]: ...
     @overload
     def __new__(
@@ -81,12 +93,92 @@ class TextChoicesField(Field[_C, _C], Generic[_C]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        db_enum_type: str | None = ...,
     ) -> TextChoicesField[_C | None]: ...
 
+class CompactTextChoicesField(Field[_C, _C], Generic[_C]):
+    choices_enum: type[_C]
+    codes: dict[str, int]
+    trusted_reads: bool
+    def from_db_values(self, values: Sequence[Any]) -> list[_C]: ...
+    def validate_many(self, values: Iterable[Any]) -> ValidatedValues: ...
+    @overload
+    def __new__(
+        cls,
+        choices_enum: type[_C],
+        verbose_name: StrOrPromise | None = ...,
+        name: str | None = ...,
+        primary_key: bool = ...,
+        max_length: int | None = ...,
+        unique: bool = ...,
+        blank: bool = ...,
+        null: Literal[False] = ...,
+        db_index: bool = ...,
+        default: _C | Callable[[], _C] = ...,
+        editable: bool = ...,
+        auto_created: bool = ...,
+        serialize: bool = ...,
+        unique_for_date: str | None = ...,
+        unique_for_month: str | None = ...,
+        unique_for_year: str | None = ...,
+        help_text: StrOrPromise = ...,
+        db_column: str | None = ...,
+        db_tablespace: str | None = ...,
+        validators: Iterable[_ValidatorCallable] = ...,
+        error_messages: _ErrorMessagesToOverride | None = ...,
+        path: str | Callable[..., str] = ...,
+        match: str | None = ...,
+        recursive: bool = ...,
+        allow_files: bool = ...,
+        allow_folders: bool = ...,
+        *,
+        codes: Mapping[_C | str, int],
+        trusted_reads: bool = ...,
+    ) -> CompactTextChoicesField[_C]: ...
+    @overload
+    def __new__(
+        cls,
+        choices_enum: type[_C],
+        verbose_name: StrOrPromise | None = ...,
+        name: str | None = ...,
+        primary_key: bool = ...,
+        max_length: int | None = ...,
+        unique: bool = ...,
+        blank: bool = ...,
+        null: Literal[True] = ...,
+        db_index: bool = ...,
+        default: _C | Callable[[], _C] | None = ...,
+        editable: bool = ...,
+        auto_created: bool = ...,
+        serialize: bool = ...,
+        unique_for_date: str | None = ...,
+        unique_for_month: str | None = ...,
+        unique_for_year: str | None = ...,
+        help_text: StrOrPromise = ...,
+        db_column: str | None = ...,
+        db_tablespace: str | None = ...,
+        validators: Iterable[_ValidatorCallable] = ...,
+        error_messages: _ErrorMessagesToOverride | None = ...,
+        path: str | Callable[..., str] = ...,
+        match: str | None = ...,
+        recursive: bool = ...,
+        allow_files: bool = ...,
+        allow_folders: bool = ...,
+        *,
+        codes: Mapping[_C | str, int],
+        trusted_reads: bool = ...,
+    ) -> CompactTextChoicesField[_C | None]: ...
+
 _I = TypeVar("_I", bound=IntegerChoices | None)
 
 class IntegerChoicesField(Field[_I, _I], Generic[_I]):
     choices_enum: type[_I]
+    trusted_reads: bool
+    integer_size: Literal["small", "regular", "big"] | None
+    def from_db_values(self, values: Sequence[Any]) -> list[_I]: ...
+    def validate_many(self, values: Iterable[Any]) -> ValidatedValues: ...
     @overload
     def __new__(
         cls,
@@ -116,6 +208,9 @@ class IntegerChoicesField(Field[_I, _I], Generic[_I]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        integer_size: Literal["auto", "small", "regular", "big"] | None = ...,
     ) -> IntegerChoicesField[_I]: ...
     @overload
     def __new__(
@@ -146,12 +241,19 @@ class IntegerChoicesField(Field[_I, _I], Generic[_I]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        integer_size: Literal["auto", "small", "regular", "big"] | None = ...,
     ) -> IntegerChoicesField[_I | None]: ...
 
 _IF = TypeVar("_IF", bound=IntegerChoicesFlag | None)
 
 class IntegerChoicesFlagField(Field[_IF, _IF], Generic[_IF]):
     choices_enum: type[_IF]
+    trusted_reads: bool
+    integer_size: Literal["small", "regular", "big"] | None
+    def from_db_values(self, values: Sequence[Any]) -> list[_IF]: ...
+    def validate_many(self, values: Iterable[Any]) -> ValidatedValues: ...
     @overload
     def __new__(
         cls,
@@ -181,6 +283,9 @@ class IntegerChoicesFlagField(Field[_IF, _IF], Generic[_IF]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        integer_size: Literal["auto", "small", "regular", "big"] | None = ...,
     ) -> IntegerChoicesFlagField[_IF]: ...
     @overload
     def __new__(
@@ -211,4 +316,7 @@ class IntegerChoicesFlagField(Field[_IF, _IF], Generic[_IF]):
         recursive: bool = ...,
         allow_files: bool = ...,
         allow_folders: bool = ...,
+        *,
+        trusted_reads: bool = ...,
+        integer_size: Literal["auto", "small", "regular", "big"] | None = ...,
     ) -> IntegerChoicesFlagField[_IF | None]: ...
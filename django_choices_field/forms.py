@@ -0,0 +1,65 @@
+import functools
+import operator
+from typing import Any
+
+from django import forms
+
+from .types import IntegerChoicesFlag
+
+
+def _get_flag_bits(value: Any) -> list[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple)):
+        # Already the submitted checkboxes
+        return [str(v) for v in value]
+
+    value = int(value)
+    bit = 1
+    bits = []
+    while bit <= value:
+        if value & bit:
+            bits.append(str(bit))
+        bit <<= 1
+    return bits
+
+
+class FlagCheckboxSelectMultiple(forms.CheckboxSelectMultiple):
+    """Render a flags value as one checkbox per flag, checking the ones it has set."""
+
+    def format_value(self, value):
+        return _get_flag_bits(value)
+
+
+class IntegerChoicesFlagFormField(forms.TypedMultipleChoiceField):
+    """Form field for an IntegerChoicesFlag enum, with one choice per flag.
+
+    The checked flags are combined with `|` when cleaning, so the rendering cost only
+    grows with the number of flags, instead of the number of their combinations. No
+    flags checked cleans to `None`.
+    """
+
+    widget = FlagCheckboxSelectMultiple
+
+    def __init__(self, *, choices_enum: type[IntegerChoicesFlag], **kwargs):
+        self.choices_enum = choices_enum
+        kwargs.setdefault("choices", [(member.value, member.label) for member in choices_enum])
+        kwargs.setdefault("coerce", int)
+        kwargs.setdefault("empty_value", None)
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value):
+        return _get_flag_bits(value)
+
+    def clean(self, value):
+        value = super().clean(value)
+        if not value:
+            return None
+
+        return self.choices_enum(functools.reduce(operator.or_, value))
+
+    def has_changed(self, initial, data):
+        if self.disabled:
+            return False
+
+        return set(_get_flag_bits(initial)) != set(_get_flag_bits(data))
@@ -0,0 +1,97 @@
+from collections.abc import Sequence
+from typing import Any
+
+from django.db import models
+from django.db.backends.utils import names_digest, split_identifier
+
+from .types import IntegerChoicesFlag
+
+
+class _FlagIndex(models.Index):
+    """An index for one flag, named after its model once the model is declared.
+
+    Like Django does for indexes declared without a name, the name is made of the
+    truncated table and column names followed by a digest of the full ones, so that
+    it fits in 30 characters while staying unique across models.
+    """
+
+    def __init__(self, *expressions: Any, field_name: str, bit: int, **kwargs: Any):
+        # Indexes on expressions or with a condition must be declared with a name, so
+        # a placeholder is given and cleared for the model to name it instead
+        super().__init__(*expressions, name=f"flag_{bit}", **kwargs)
+        self.name = ""
+        self.field_name = field_name
+        self.bit = bit
+
+    def set_name_with_model(self, model: type[models.Model]):
+        opts = model._meta  # noqa: SLF001
+        _, table_name = split_identifier(opts.db_table)
+        column = opts.get_field(self.field_name).column
+        digest = names_digest(table_name, column, str(self.bit), length=6)
+        self.name = f"{table_name[:11]}_{column[:7]}_{digest}_{self.bit}"
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+        if self.name:
+            # Once named, it's a plain index, which is what migrations reference
+            return "django.db.models.Index", args, kwargs
+
+        del kwargs["name"]
+        return path, args, {**kwargs, "field_name": self.field_name, "bit": self.bit}
+
+    def clone(self):
+        if not self.name:
+            return super().clone()
+
+        _path, args, kwargs = self.deconstruct()
+        return models.Index(*args, **kwargs)
+
+
+def get_flag_indexes(
+    field_name: str,
+    choices_enum: type[IntegerChoicesFlag],
+    *,
+    fields: Sequence[str] | None = None,
+    name_prefix: str | None = None,
+    **kwargs: Any,
+) -> list[models.Index]:
+    """Return one index per member of `choices_enum` for an IntegerChoicesFlagField.
+
+    Bitwise predicates can't use a plain B-tree index on the column itself. Each
+    index returned here covers the `(col & bit) <> 0` predicate for one member,
+    which is what the `has_any` lookup compiles to when filtering by that member.
+
+    By default those are functional indexes on the predicate itself, which databases
+    like PostgreSQL match against boolean conditions. When `fields` is given, partial
+    indexes on those fields using the predicate as their condition are returned
+    instead, which SQLite can use as well.
+
+    The index names are `<name_prefix>_<bit position>`. Without `name_prefix`, they
+    are generated from the model's table, the field's column and a digest of both
+    when the model is declared, the same way Django names indexes declared without a
+    name. Any other keyword argument is passed to each `Index`.
+
+    Usage:
+        class Meta:
+            indexes = [*get_flag_indexes("flags", Flags)]
+    """
+    indexes = []
+    for member in choices_enum:
+        value = member.value
+        bit = value.bit_length() - 1
+        condition = models.Q(**{f"{field_name}__has_any": value})
+        index_kwargs = dict(kwargs)
+        if fields is not None:
+            expressions = ()
+            index_kwargs.update(fields=list(fields), condition=condition)
+        else:
+            expressions = (models.ExpressionWrapper(condition, output_field=models.BooleanField()),)
+
+        if name_prefix:
+            index = models.Index(*expressions, name=f"{name_prefix}_{bit}", **index_kwargs)
+        else:
+            index = _FlagIndex(*expressions, field_name=field_name, bit=bit, **index_kwargs)
+
+        indexes.append(index)
+
+    return indexes
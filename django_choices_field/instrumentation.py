@@ -0,0 +1,202 @@
+"""Optional instrumentation of the conversions done by the choices fields.
+
+All the fields resolve values to enum members through a `MemberLookup`. While at
+least one listener is registered with `add_listener`, its methods are replaced by
+instrumented ones that report each resolved value to the listeners. Removing the
+last listener restores the original methods, meaning that there's no overhead at
+all while instrumentation is disabled.
+
+Listeners are called with `(event, choices_enum, count, duration)`, where `event`
+is one of:
+
+- `"conversion"`: `count` values were resolved to members. `duration` is the time
+  it took, in seconds, when timing is enabled, or `None` otherwise.
+- `"cache_hit"`: `count` values were found in the lookup's mapping.
+- `"cache_miss"`: `count` values had to go through the enum itself.
+- `"validation_failure"`: `count` values were not valid for the enum.
+"""
+
+import enum
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from .choices import MemberLookup
+
+Listener = Callable[[str, type[enum.Enum], int, "float | None"], None]
+
+CONVERSION = "conversion"
+CACHE_HIT = "cache_hit"
+CACHE_MISS = "cache_miss"
+VALIDATION_FAILURE = "validation_failure"
+
+_listeners: dict[Listener, bool] = {}
+_timing = False
+_lock = threading.Lock()
+
+_original_call = MemberLookup.__call__
+_original_find = MemberLookup.find
+_original_get = MemberLookup.get
+_original_map = MemberLookup.map
+_original_reject = MemberLookup.reject
+
+
+def _emit(event: str, choices_enum: type[enum.Enum], count: int, duration: float | None = None):
+    for listener, timing in list(_listeners.items()):
+        # Only the listeners that asked for them get the durations
+        listener(event, choices_enum, count, duration if timing else None)
+
+
+def _instrumented_call(self: MemberLookup, value: Any) -> Any:
+    start = time.perf_counter() if _timing else None
+    try:
+        hit = value in self._members
+    except TypeError:
+        hit = False
+
+    try:
+        member = _original_call(self, value)
+    except ValueError:
+        _emit(VALIDATION_FAILURE, self.choices_enum, 1)
+        raise
+
+    _emit(CACHE_HIT if hit else CACHE_MISS, self.choices_enum, 1)
+    _emit(CONVERSION, self.choices_enum, 1, None if start is None else time.perf_counter() - start)
+    return member
+
+
+def _instrumented_find(self: MemberLookup, value: Any) -> Any:
+    start = time.perf_counter() if _timing else None
+    member = _original_find(self, value)
+    # Misses are either resolved through __call__ or rejected, which reports them
+    if member is not None:
+        _emit(CACHE_HIT, self.choices_enum, 1)
+        _emit(
+            CONVERSION,
+            self.choices_enum,
+            1,
+            None if start is None else time.perf_counter() - start,
+        )
+    return member
+
+
+def _instrumented_get(self: MemberLookup, value: Any) -> Any:
+    start = time.perf_counter() if _timing else None
+    try:
+        member = self._members[value]
+    except KeyError:
+        # Goes through __call__, which reports it
+        return _original_get(self, value)
+
+    _emit(CACHE_HIT, self.choices_enum, 1)
+    _emit(CONVERSION, self.choices_enum, 1, None if start is None else time.perf_counter() - start)
+    return member
+
+
+def _instrumented_map(
+    self: MemberLookup,
+    values: Sequence[Any],
+    fallback: Callable[[Any], Any],
+) -> list[Any]:
+    start = time.perf_counter() if _timing else None
+    result = list(map(self._members.get, values))
+    if hits := len(result) - result.count(None):
+        _emit(CACHE_HIT, self.choices_enum, hits)
+        _emit(
+            CONVERSION,
+            self.choices_enum,
+            hits,
+            None if start is None else time.perf_counter() - start,
+        )
+
+    # The fallback goes through __call__ for values that are not None, which
+    # reports them
+    if hits != len(result):
+        for i, member in enumerate(result):
+            if member is None:
+                result[i] = fallback(values[i])
+
+    return result
+
+
+def _instrumented_reject(self: MemberLookup, count: int):
+    if count:
+        _emit(VALIDATION_FAILURE, self.choices_enum, count)
+
+
+def _update():
+    global _timing  # noqa: PLW0603
+
+    _timing = any(_listeners.values())
+    if _listeners:
+        MemberLookup.__call__ = _instrumented_call
+        MemberLookup.find = _instrumented_find
+        MemberLookup.get = _instrumented_get
+        MemberLookup.map = _instrumented_map
+        MemberLookup.reject = _instrumented_reject
+    else:
+        MemberLookup.__call__ = _original_call
+        MemberLookup.find = _original_find
+        MemberLookup.get = _original_get
+        MemberLookup.map = _original_map
+        MemberLookup.reject = _original_reject
+
+
+def add_listener(listener: Listener, *, timing: bool = False):
+    """Register a listener for the conversion events, enabling instrumentation.
+
+    Pass `timing=True` to have the duration of the conversions measured as well.
+    """
+    with _lock:
+        _listeners[listener] = timing
+        _update()
+
+
+def remove_listener(listener: Listener):
+    """Unregister a listener, disabling instrumentation if it was the last one."""
+    with _lock:
+        _listeners.pop(listener, None)
+        _update()
+
+
+class Counters:
+    """A listener that aggregates the events in memory.
+
+    Register it with `add_listener` and read it with `snapshot`, e.g. periodically
+    or from a metrics endpoint, to export the counters to Prometheus, StatsD, etc.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[str, str], int] = {}
+        self._durations: dict[tuple[str, str], float] = {}
+
+    def __call__(
+        self,
+        event: str,
+        choices_enum: type[enum.Enum],
+        count: int,
+        duration: float | None,
+    ):
+        key = (event, f"{choices_enum.__module__}.{choices_enum.__qualname__}")
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + count
+            if duration is not None:
+                self._durations[key] = self._durations.get(key, 0.0) + duration
+
+    def snapshot(self, *, reset: bool = False) -> dict[tuple[str, str], tuple[int, float]]:
+        """Return the counts and total durations (in seconds) of the events.
+
+        They are keyed by `(event, enum path)`. Pass `reset=True` to start counting
+        from zero again afterwards, e.g. when exporting deltas to StatsD.
+        """
+        with self._lock:
+            result = {
+                key: (count, self._durations.get(key, 0.0)) for key, count in self._counts.items()
+            }
+            if reset:
+                self._counts.clear()
+                self._durations.clear()
+
+        return result
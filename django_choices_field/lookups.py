@@ -0,0 +1,56 @@
+from django.db.models import Lookup
+
+
+class _FlagLookup(Lookup):
+    def process_rhs(self, compiler, connection):
+        # The mask is inlined as a literal, so that the database can match the
+        # predicate against partial and functional indexes on it. That is safe
+        # since it has already been validated as an integer by the field.
+        if self.rhs_is_direct_value() and isinstance(self.rhs, int):
+            return str(int(self.rhs)), ()
+        return super().process_rhs(compiler, connection)
+
+    def process_bitand(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        bitand = connection.ops.combine_expression("&", [lhs, rhs])
+        return f"({bitand})", (*lhs_params, *rhs_params), rhs, tuple(rhs_params)
+
+
+class HasAll(_FlagLookup):
+    """Match rows that have all the flags in the given value set (`col & mask = mask`).
+
+    Rows where the column is `NULL` never match.
+    """
+
+    lookup_name = "has_all"
+
+    def as_sql(self, compiler, connection):
+        bitand, params, rhs, rhs_params = self.process_bitand(compiler, connection)
+        return f"{bitand} = {rhs}", (*params, *rhs_params)
+
+
+class HasAny(_FlagLookup):
+    """Match rows that have any of the flags in the given value set (`col & mask <> 0`).
+
+    Rows where the column is `NULL` never match.
+    """
+
+    lookup_name = "has_any"
+
+    def as_sql(self, compiler, connection):
+        bitand, params, _rhs, _rhs_params = self.process_bitand(compiler, connection)
+        return f"{bitand} <> 0", params
+
+
+class HasNone(_FlagLookup):
+    """Match rows that have none of the flags in the given value set (`col & mask = 0`).
+
+    Rows where the column is `NULL` never match.
+    """
+
+    lookup_name = "has_none"
+
+    def as_sql(self, compiler, connection):
+        bitand, params, _rhs, _rhs_params = self.process_bitand(compiler, connection)
+        return f"{bitand} = 0", params
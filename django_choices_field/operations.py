@@ -0,0 +1,126 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.db import NotSupportedError, models
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.operations.base import Operation
+
+
+def _get_enum_values(values: type[models.TextChoices] | Iterable[str]) -> list[str]:
+    if isinstance(values, type) and issubclass(values, models.TextChoices):
+        return [member.value for member in values]
+    return list(values)
+
+
+class _EnumTypeOperation(Operation):
+    reduces_to_sql = True
+
+    def __init__(self, name: str, values: type[models.TextChoices] | Iterable[str]):
+        self.name = name
+        self.values = _get_enum_values(values)
+
+    def deconstruct(self):
+        return self.__class__.__name__, [self.name, self.values], {}
+
+    def state_forwards(self, app_label, state):
+        # Database types are not part of the models' state
+        pass
+
+    def _execute(self, schema_editor, get_sqls: Callable[[Any], list[str]]):
+        # Other backends store the values in the varchar column the field falls back to
+        if schema_editor.connection.vendor != "postgresql":
+            return
+
+        for sql in get_sqls(schema_editor):
+            schema_editor.execute(sql, params=None)
+
+    def _quote_values(self, schema_editor, values: Iterable[str]) -> str:
+        return ", ".join(schema_editor.quote_value(value) for value in values)
+
+
+class CreateEnumType(_EnumTypeOperation):
+    """Create the PostgreSQL enum type used by a TextChoicesField with `db_enum_type`.
+
+    The values can be given as a TextChoices enum, in which case they are written to
+    the migration as a list of its values. This is a no-op on other databases.
+    """
+
+    def get_forwards_sql(self, schema_editor) -> list[str]:
+        name = schema_editor.quote_name(self.name)
+        return [f"CREATE TYPE {name} AS ENUM ({self._quote_values(schema_editor, self.values)})"]
+
+    def get_backwards_sql(self, schema_editor) -> list[str]:
+        return [f"DROP TYPE {schema_editor.quote_name(self.name)}"]
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self._execute(schema_editor, self.get_forwards_sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self._execute(schema_editor, self.get_backwards_sql)
+
+    def describe(self):
+        return f"Create enum type {self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"create_enum_{self.name.lower()}"
+
+
+class AlterEnumType(_EnumTypeOperation):
+    """Add the missing values to a PostgreSQL enum type created by CreateEnumType.
+
+    Each value is added with `ADD VALUE IF NOT EXISTS`, so the values the type
+    already has can be listed as well (e.g. by giving the TextChoices enum itself).
+    PostgreSQL can't remove values from an enum type, so values that are not listed
+    are kept, and reversing this operation raises `NotSupportedError`. This is a
+    no-op on other databases.
+
+    The added values can't be used in the same transaction that added them, so data
+    migrations using them should go in a separate migration.
+    """
+
+    reversible = False
+
+    def get_forwards_sql(self, schema_editor) -> list[str]:
+        name = schema_editor.quote_name(self.name)
+        return [
+            f"ALTER TYPE {name} ADD VALUE IF NOT EXISTS {schema_editor.quote_value(value)}"
+            for value in self.values
+        ]
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self._execute(schema_editor, self.get_forwards_sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        raise NotSupportedError(f"Values can't be removed from the enum type {self.name}.")
+
+    def describe(self):
+        return f"Alter enum type {self.name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"alter_enum_{self.name.lower()}"
+
+
+def get_migrated_enum_types() -> dict[str, set[str]]:
+    """Return the values of the enum types created and altered by the migrations.
+
+    The migration files are read from disk, without accessing the database, and
+    their CreateEnumType and AlterEnumType operations are applied in order.
+    """
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    enum_types: dict[str, set[str]] = {}
+    seen = set()
+    for leaf in loader.graph.leaf_nodes():
+        for key in loader.graph.forwards_plan(leaf):
+            if key in seen:
+                continue
+            seen.add(key)
+
+            for operation in loader.graph.nodes[key].operations:
+                if isinstance(operation, CreateEnumType):
+                    enum_types[operation.name] = set(operation.values)
+                elif isinstance(operation, AlterEnumType):
+                    enum_types.setdefault(operation.name, set()).update(operation.values)
+
+    return enum_types
@@ -0,0 +1,122 @@
+import functools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from django.db import connections, models
+from django.db.models.expressions import Col
+from django.db.models.sql import Query
+from django.db.models.sql.compiler import SQLCompiler
+from django.db.models.sql.constants import MULTI
+
+from .fields import (
+    CompactTextChoicesField,
+    IntegerChoicesField,
+    IntegerChoicesFlagField,
+    TextChoicesField,
+)
+
+_ChoicesField: TypeAlias = (
+    TextChoicesField | CompactTextChoicesField | IntegerChoicesField | IntegerChoicesFlagField
+)
+_CHOICES_FIELDS = (
+    TextChoicesField,
+    CompactTextChoicesField,
+    IntegerChoicesField,
+    IntegerChoicesFlagField,
+)
+
+_CompilerBase = SQLCompiler if TYPE_CHECKING else object
+_QuerySetBase = models.QuerySet if TYPE_CHECKING else object
+
+
+class ChoicesCompilerMixin(_CompilerBase):
+    """Compiler mixin that converts choices columns one chunk at a time.
+
+    Instead of letting Django call `from_db_value` for every cell, the values of
+    each choices column in a chunk of fetched rows are resolved together through
+    the field's member lookup. Anything that is not a plain choices column (e.g.
+    annotations) is left for the default converters.
+    """
+
+    def _get_choices_columns(self) -> dict[int, _ChoicesField]:
+        columns = {}
+        for i, (expression, _sql, _alias) in enumerate(self.select[0 : self.col_count]):
+            if (
+                isinstance(expression, Col)
+                and isinstance(expression.output_field, _CHOICES_FIELDS)
+                and not self.connection.ops.get_db_converters(expression)
+            ):
+                columns[i] = expression.output_field
+        return columns
+
+    def _convert_chunks(
+        self,
+        chunks: Iterable[Sequence[Sequence[Any]]],
+        columns: dict[int, _ChoicesField],
+    ) -> Iterator[Sequence[Sequence[Any]]]:
+        for rows in chunks:
+            if not rows:
+                yield rows
+                continue
+
+            data = list(zip(*rows, strict=True))
+            for pos, field in columns.items():
+                data[pos] = field.from_db_values(data[pos])
+            yield list(zip(*data, strict=True))
+
+    def get_converters(self, expressions):
+        converters = super().get_converters(expressions)
+        for pos in self._get_choices_columns():
+            converters.pop(pos, None)
+        return converters
+
+    def execute_sql(self, result_type=MULTI, *args, **kwargs):
+        result = super().execute_sql(result_type, *args, **kwargs)
+        if result_type != MULTI:
+            return result
+
+        columns = self._get_choices_columns()
+        if not columns:
+            return result
+
+        converted = self._convert_chunks(result, columns)
+        return list(converted) if isinstance(result, list) else converted
+
+
+@functools.cache
+def _get_compiler_class(compiler_class: type) -> type:
+    return type(compiler_class.__name__, (ChoicesCompilerMixin, compiler_class), {})
+
+
+class ChoicesQuery(Query):
+    """Query that hydrates choices columns in batches when selecting rows."""
+
+    def get_compiler(self, using=None, connection=None, elide_empty=True):
+        if self.compiler != "SQLCompiler":
+            return super().get_compiler(using, connection, elide_empty)
+
+        if using is None and connection is None:
+            raise ValueError("Need either using or connection")
+        if using:
+            connection = connections[using]
+        compiler_class = _get_compiler_class(connection.ops.compiler(self.compiler))
+        return compiler_class(self, connection, using, elide_empty)
+
+
+class ChoicesQuerySetMixin(_QuerySetBase):
+    """QuerySet mixin that hydrates choices fields column-wise.
+
+    Use it to create a custom queryset, e.g. `class MyQuerySet(ChoicesQuerySetMixin,
+    models.QuerySet)`, so that `list(qs)`, `.values()` and `.values_list()` convert
+    the fetched values of all choices fields in batches, instead of calling
+    `from_db_value` for each row.
+    """
+
+    def __init__(self, model=None, query=None, using=None, hints=None):
+        if query is None:
+            query = ChoicesQuery(model)
+        super().__init__(model=model, query=query, using=using, hints=hints)
+
+
+class ChoicesQuerySet(ChoicesQuerySetMixin, models.QuerySet):
+    """A QuerySet that hydrates choices fields column-wise."""
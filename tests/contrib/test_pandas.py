@@ -0,0 +1,52 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from django_choices_field.contrib.pandas import decompose_flags, to_categorical  # noqa: E402
+from tests.models import MyModel  # noqa: E402
+
+
+def test_to_categorical_text():
+    f = MyModel._meta.get_field("c_field_nullable")
+    result = to_categorical(f, ["bar", None, "foo", "invalid", "bar"])
+    assert list(result.categories) == ["T Foo Description", "T Bar Description"]
+    assert list(result.codes) == [1, -1, 0, -1, 1]
+
+
+def test_to_categorical_compact_text():
+    f = MyModel._meta.get_field("cc_field")
+    result = to_categorical(f, pd.Series([2, 1, 3]))
+    assert list(result.categories) == ["T Foo Description", "T Bar Description"]
+    assert list(result.codes) == [1, 0, -1]
+
+
+def test_to_categorical_integer():
+    f = MyModel._meta.get_field("i_field")
+    result = to_categorical(f, iter([1, 2, 2, 5]))
+    assert list(result.categories) == ["I Foo Description", "I Bar Description"]
+    assert list(result.codes) == [0, 1, 1, -1]
+
+
+def test_to_categorical_flags():
+    f = MyModel._meta.get_field("ift_field_nullable")
+    result = to_categorical(f, [5, None, 1, 8, 5])
+    assert list(result.categories) == [
+        "IF Foo Description",
+        "IF Foo Description|IF Bin Description",
+    ]
+    assert list(result.codes) == [1, -1, 0, -1, 1]
+
+
+def test_decompose_flags():
+    f = MyModel._meta.get_field("if_field_nullable")
+    values = pd.Series([5, None, 2], index=[10, 20, 30])
+    result = decompose_flags(f, values)
+    assert list(result.columns) == ["IF_FOO", "IF_BAR", "IF_BIN"]
+    assert list(result.index) == [10, 20, 30]
+    assert result.loc[20].isna().all()
+    assert result.drop(index=20).astype(bool).to_dict("list") == {
+        "IF_FOO": [True, False],
+        "IF_BAR": [False, True],
+        "IF_BIN": [True, False],
+    }
+    assert str(result.dtypes["IF_FOO"]) == "boolean"
@@ -0,0 +1,11 @@
+from django.db import migrations
+
+from django_choices_field.operations import CreateEnumType
+
+
+class Migration(migrations.Migration):
+    dependencies = [("tests", "0000_missing")]
+
+    operations = [
+        CreateEnumType("text_enum", ["foo", "bar"]),
+    ]
@@ -0,0 +1,10 @@
+from django.db import migrations
+
+from django_choices_field.operations import CreateEnumType
+
+
+class Migration(migrations.Migration):
+    operations = [
+        CreateEnumType("text_enum", ["foo"]),
+        CreateEnumType("other_enum", ["foo", "bar"]),
+    ]
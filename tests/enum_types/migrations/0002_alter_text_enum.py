@@ -0,0 +1,11 @@
+from django.db import migrations
+
+from django_choices_field.operations import AlterEnumType
+
+
+class Migration(migrations.Migration):
+    dependencies = [("tests", "0001_initial")]
+
+    operations = [
+        AlterEnumType("text_enum", ["foo", "bar"]),
+    ]
@@ -4,8 +4,11 @@ import sys
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from django_choices_field import IntegerChoicesField, TextChoicesField
+from django_choices_field import CompactTextChoicesField, IntegerChoicesField, TextChoicesField
+from django_choices_field.expressions import ChoiceOrder
 from django_choices_field.fields import IntegerChoicesFlagField
+from django_choices_field.indexes import get_flag_indexes
+from django_choices_field.query import ChoicesQuerySet
 from django_choices_field.types import IntegerChoicesFlag
 
 
@@ -72,6 +75,7 @@ class MyModel(models.Model):
         )
 
     objects = models.Manager["MyModel"]()
+    choices_objects = ChoicesQuerySet.as_manager()
 
     c_field = TextChoicesField(
         choices_enum=TextEnum,
@@ -89,6 +93,16 @@ class MyModel(models.Model):
         choices_enum=TextEnumWithEmptyStateLabel,
         null=True,
     )
+    cc_field = CompactTextChoicesField(
+        choices_enum=TextEnum,
+        codes={TextEnum.C_FOO: 1, TextEnum.C_BAR: 2},
+        default=TextEnum.C_FOO,
+    )
+    cc_field_nullable = CompactTextChoicesField(
+        choices_enum=TextEnum,
+        codes={"foo": 1, "bar": 2},
+        null=True,
+    )
     i_field = IntegerChoicesField(
         choices_enum=IntegerEnum,
         default=IntegerEnum.I_FOO,
@@ -129,3 +143,70 @@ class MyModel(models.Model):
         choices_enum=IntegerFlagEnumWithEmptyStateLabel,
         null=True,
     )
+
+
+class IndexedFlagModel(models.Model):
+    objects = models.Manager["IndexedFlagModel"]()
+
+    flags = IntegerChoicesFlagField(
+        choices_enum=MyModel.IntegerFlagEnum,
+        default=MyModel.IntegerFlagEnum.IF_FOO,
+    )
+    flags_nullable = IntegerChoicesFlagField(
+        choices_enum=MyModel.IntegerFlagEnum,
+        null=True,
+    )
+
+    class Meta:
+        indexes = [  # noqa: RUF012
+            *get_flag_indexes("flags", MyModel.IntegerFlagEnum),
+            *get_flag_indexes(
+                "flags_nullable",
+                MyModel.IntegerFlagEnum,
+                fields=["id"],
+                name_prefix="flags_null",
+            ),
+        ]
+
+
+class IndexedFlagModelArchive(models.Model):
+    objects = models.Manager["IndexedFlagModelArchive"]()
+
+    flags = IntegerChoicesFlagField(
+        choices_enum=MyModel.IntegerFlagEnum,
+        default=MyModel.IntegerFlagEnum.IF_FOO,
+    )
+
+    class Meta:
+        indexes = [*get_flag_indexes("flags", MyModel.IntegerFlagEnum)]  # noqa: RUF012
+
+
+class OrderedModel(models.Model):
+    class StatusEnum(models.TextChoices):
+        NEW = "new", "New"
+        IN_PROGRESS = "in_progress", "In Progress"
+        DONE = "done", "Done"
+
+    objects = models.Manager["OrderedModel"]()
+
+    status = TextChoicesField(
+        choices_enum=StatusEnum,
+        default=StatusEnum.NEW,
+    )
+
+    class Meta:
+        indexes = [models.Index(ChoiceOrder("status"), name="status_order")]  # noqa: RUF012
+
+
+class DiscountModel(models.Model):
+    class DiscountEnum(models.TextChoices):
+        HALF = "50%s off", "Half %s price"
+        FULL = "100%% off", "100%% off"
+        TENTH = "10% off", "10% off"
+
+    objects = models.Manager["DiscountModel"]()
+
+    discount = TextChoicesField(choices_enum=DiscountEnum)
+
+    class Meta:
+        indexes = [models.Index(ChoiceOrder("discount"), name="discount_order")]  # noqa: RUF012
@@ -0,0 +1,74 @@
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from django_choices_field.aggregates import FlagCount, get_flag_counts
+
+from .models import MyModel
+
+Flags = MyModel.IntegerFlagEnum
+
+
+def _create_objects():
+    MyModel.objects.create(if_field=Flags.IF_FOO | Flags.IF_BIN, if_field_nullable=Flags.IF_BAR)
+    MyModel.objects.create(if_field=Flags.IF_FOO, if_field_nullable=None)
+    MyModel.objects.create(if_field=Flags.IF_BAR | Flags.IF_BIN, if_field_nullable=Flags.IF_BAR)
+
+
+def test_flag_count(db):
+    _create_objects()
+
+    assert MyModel.objects.aggregate(
+        foo=FlagCount("if_field", Flags.IF_FOO),
+        foo_or_bar=FlagCount("if_field", Flags.IF_FOO | Flags.IF_BAR),
+        bar_nullable=FlagCount("if_field_nullable", Flags.IF_BAR),
+        foo_and_bin=FlagCount(
+            "if_field",
+            Flags.IF_FOO,
+            filter=models.Q(if_field__has_any=Flags.IF_BIN),
+        ),
+    ) == {"foo": 2, "foo_or_bar": 3, "bar_nullable": 2, "foo_and_bin": 1}
+
+
+def test_flag_count_annotate(db):
+    _create_objects()
+
+    rows = (
+        MyModel.objects.values("if_field_nullable")
+        .annotate(foo=FlagCount("if_field", Flags.IF_FOO))
+        .order_by("if_field_nullable")
+    )
+    assert [(r["if_field_nullable"], r["foo"]) for r in rows] == [
+        (None, 1),
+        (Flags.IF_BAR, 1),
+    ]
+
+
+def test_get_flag_counts(db):
+    _create_objects()
+
+    with CaptureQueriesContext(connection) as ctx:
+        counts = get_flag_counts(MyModel.objects.all(), "if_field")
+    assert len(ctx.captured_queries) == 1
+    assert counts == {Flags.IF_FOO: 2, Flags.IF_BAR: 1, Flags.IF_BIN: 2}
+    assert all(isinstance(k, Flags) for k in counts)
+
+    assert get_flag_counts(MyModel.objects.filter(if_field=Flags.IF_FOO), "if_field") == {
+        Flags.IF_FOO: 1,
+        Flags.IF_BAR: 0,
+        Flags.IF_BIN: 0,
+    }
+    assert get_flag_counts(MyModel.objects.all(), "if_field_nullable") == {
+        Flags.IF_FOO: 0,
+        Flags.IF_BAR: 2,
+        Flags.IF_BIN: 0,
+    }
+
+
+def test_get_flag_counts_empty(db):
+    assert get_flag_counts(MyModel.objects.all(), "if_field") == dict.fromkeys(Flags, 0)
+
+
+def test_get_flag_counts_invalid_field():
+    with pytest.raises(TypeError, match="i_field is not an IntegerChoicesFlagField"):
+        get_flag_counts(MyModel.objects.all(), "i_field")
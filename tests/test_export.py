@@ -0,0 +1,98 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from django_choices_field.export import iter_labels
+
+from .models import MyModel
+
+
+def _create_objects():
+    MyModel.objects.create(
+        c_field=MyModel.TextEnum.C_BAR,
+        cc_field=MyModel.TextEnum.C_BAR,
+        i_field=MyModel.IntegerEnum.I_BAR,
+        if_field=MyModel.IntegerFlagEnum.IF_FOO | MyModel.IntegerFlagEnum.IF_BIN,
+    )
+    MyModel.objects.create(
+        c_field_nullable=MyModel.TextEnum.C_FOO,
+        i_field_nullable=MyModel.IntegerEnum.I_FOO,
+        if_field_nullable=MyModel.IntegerFlagEnum.IF_BAR,
+    )
+
+
+def test_iter_labels(db):
+    _create_objects()
+
+    rows = iter_labels(
+        MyModel.objects.order_by("pk"),
+        "id",
+        "c_field",
+        "c_field_nullable",
+        "cc_field",
+        "i_field_nullable",
+        "if_field",
+        "if_field_nullable",
+    )
+    assert list(rows) == [
+        (
+            1,
+            "T Bar Description",
+            None,
+            "T Bar Description",
+            None,
+            "IF Foo Description|IF Bin Description",
+            None,
+        ),
+        (
+            2,
+            "T Foo Description",
+            "T Foo Description",
+            "T Foo Description",
+            "I Foo Description",
+            "IF Foo Description",
+            "IF Bar Description",
+        ),
+    ]
+
+
+def test_iter_labels_without_choices_fields(db):
+    _create_objects()
+
+    assert list(iter_labels(MyModel.objects.order_by("pk"), "id")) == [(1,), (2,)]
+
+
+def test_iter_labels_chunks(db):
+    _create_objects()
+
+    with CaptureQueriesContext(connection) as ctx:
+        rows = iter_labels(MyModel.choices_objects.order_by("pk"), "i_field", chunk_size=1)
+        assert next(rows) == ("I Bar Description",)
+        assert next(rows) == ("I Foo Description",)
+        with pytest.raises(StopIteration):
+            next(rows)
+    assert len(ctx.captured_queries) == 1
+
+
+def test_iter_labels_translated(db):
+    MyModel.objects.create(
+        ift_field=MyModel.IntegerFlagEnumTranslated.IF_FOO
+        | MyModel.IntegerFlagEnumTranslated.IF_BAR,
+    )
+
+    with translation.override("en"):
+        rows = list(iter_labels(MyModel.objects.all(), "ift_field"))
+    assert rows == [("IF Foo Description|IF Bar Description",)]
+    assert all(type(label) is str for (label,) in rows)
+
+
+def test_iter_labels_invalid_values(db):
+    _create_objects()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {MyModel._meta.db_table} SET c_field = 'invalid', i_field = 5, if_field = 8",
+        )
+
+    rows = iter_labels(MyModel.objects.order_by("pk"), "c_field", "i_field", "if_field")
+    assert next(rows) == ("invalid", 5, 8)
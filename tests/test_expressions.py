@@ -0,0 +1,296 @@
+import pytest
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from django.utils.translation import gettext_lazy
+
+from django_choices_field.expressions import (
+    ChoiceLabel,
+    ChoiceOrder,
+    FlagClear,
+    FlagSet,
+    FlagToggle,
+    _ChoicesCase,
+)
+
+from .models import DiscountModel, MyModel, OrderedModel
+
+Flags = MyModel.IntegerFlagEnum
+Status = OrderedModel.StatusEnum
+Discount = DiscountModel.DiscountEnum
+
+
+def _create_objects():
+    return [
+        MyModel.objects.create(if_field=Flags.IF_FOO, if_field_nullable=None),
+        MyModel.objects.create(
+            if_field=Flags.IF_FOO | Flags.IF_BIN, if_field_nullable=Flags.IF_BAR
+        ),
+        MyModel.objects.create(if_field=Flags.IF_BAR, if_field_nullable=Flags.IF_BIN),
+    ]
+
+
+def _get_values(field_name):
+    return list(MyModel.objects.order_by("pk").values_list(field_name, flat=True))
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        (
+            FlagSet("if_field", Flags.IF_BAR),
+            [
+                Flags.IF_FOO | Flags.IF_BAR,
+                Flags.IF_FOO | Flags.IF_BAR | Flags.IF_BIN,
+                Flags.IF_BAR,
+            ],
+        ),
+        (
+            FlagSet("if_field", Flags.IF_BAR | Flags.IF_BIN),
+            [
+                Flags.IF_FOO | Flags.IF_BAR | Flags.IF_BIN,
+                Flags.IF_FOO | Flags.IF_BAR | Flags.IF_BIN,
+                Flags.IF_BAR | Flags.IF_BIN,
+            ],
+        ),
+        (
+            FlagClear("if_field", Flags.IF_FOO),
+            [Flags(0), Flags.IF_BIN, Flags.IF_BAR],
+        ),
+        (
+            FlagClear("if_field", Flags.IF_FOO | Flags.IF_BAR),
+            [Flags(0), Flags.IF_BIN, Flags(0)],
+        ),
+        (
+            FlagToggle("if_field", Flags.IF_FOO | Flags.IF_BAR),
+            [Flags.IF_BAR, Flags.IF_BAR | Flags.IF_BIN, Flags.IF_FOO],
+        ),
+        (
+            FlagToggle("if_field", 4),
+            [Flags.IF_FOO | Flags.IF_BIN, Flags.IF_FOO, Flags.IF_BAR | Flags.IF_BIN],
+        ),
+    ],
+)
+def test_flag_update(db, expression, expected):
+    _create_objects()
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert MyModel.objects.update(if_field=expression) == 3
+    assert len(ctx.captured_queries) == 1
+
+    values = _get_values("if_field")
+    assert values == expected
+    assert all(isinstance(v, Flags) for v in values)
+
+
+def test_flag_update_nullable(db):
+    _create_objects()
+
+    MyModel.objects.update(if_field_nullable=FlagSet("if_field_nullable", Flags.IF_FOO))
+    assert _get_values("if_field_nullable") == [
+        None,
+        Flags.IF_FOO | Flags.IF_BAR,
+        Flags.IF_FOO | Flags.IF_BIN,
+    ]
+
+    MyModel.objects.update(if_field_nullable=FlagClear("if_field_nullable", Flags.IF_FOO))
+    assert _get_values("if_field_nullable") == [None, Flags.IF_BAR, Flags.IF_BIN]
+
+
+def test_flag_update_filtered(db):
+    objs = _create_objects()
+
+    MyModel.objects.filter(if_field__has_any=Flags.IF_BIN).update(
+        if_field=FlagToggle("if_field", Flags.IF_BIN),
+    )
+    assert _get_values("if_field") == [Flags.IF_FOO, Flags.IF_FOO, Flags.IF_BAR]
+
+    obj = objs[2]
+    obj.if_field = FlagSet("if_field", Flags.IF_FOO)
+    obj.save(update_fields=["if_field"])
+    obj.refresh_from_db()
+    assert obj.if_field == Flags.IF_FOO | Flags.IF_BAR
+
+
+def test_flag_update_annotate(db):
+    _create_objects()
+
+    values = list(
+        MyModel.objects.order_by("pk")
+        .annotate(toggled=FlagToggle("if_field", Flags.IF_FOO))
+        .values_list("toggled", flat=True),
+    )
+    assert values == [Flags(0), Flags.IF_BIN, Flags.IF_FOO | Flags.IF_BAR]
+    assert all(isinstance(v, Flags) for v in values)
+
+
+def test_flag_update_invalid_field(db):
+    with pytest.raises(TypeError, match="i_field is not an IntegerChoicesFlagField"):
+        MyModel.objects.update(i_field=FlagSet("i_field", 1))
+
+
+def test_flag_update_invalid_flags(db):
+    with pytest.raises(TypeError, match=r"is not a member of MyModel\.IntegerFlagEnumTranslated"):
+        MyModel.objects.update(ift_field=FlagSet("ift_field", Flags.IF_FOO))
+
+    with pytest.raises(ValueError, match=r"8 is not a valid MyModel\.IntegerFlagEnum"):
+        MyModel.objects.update(if_field=FlagSet("if_field", 8))
+
+    with pytest.raises(ValueError, match=r"'1' is not a valid MyModel\.IntegerFlagEnum"):
+        MyModel.objects.update(if_field=FlagClear("if_field", "1"))  # type: ignore
+
+
+def test_flag_update_repr():
+    assert repr(FlagSet("if_field", 1)) == "FlagSet('if_field', 1)"
+
+
+def test_choice_label(db):
+    MyModel.objects.create(
+        c_field=MyModel.TextEnum.C_BAR,
+        cc_field=MyModel.TextEnum.C_BAR,
+        i_field_with_empty_state_nullable=MyModel.IntegerEnumWithEmptyStateLabel.I_BAR,
+    )
+    MyModel.objects.create(c_field=MyModel.TextEnum.C_FOO, c_field_nullable=MyModel.TextEnum.C_BAR)
+
+    rows = MyModel.objects.order_by("pk").values_list(
+        ChoiceLabel("c_field"),
+        ChoiceLabel("c_field_nullable"),
+        ChoiceLabel("cc_field"),
+        ChoiceLabel("i_field"),
+        ChoiceLabel("i_field_with_empty_state_nullable"),
+    )
+    assert list(rows) == [
+        (
+            "T Bar Description",
+            None,
+            "T Bar Description",
+            "I Foo Description",
+            "I Bar Description",
+        ),
+        (
+            "T Foo Description",
+            "T Bar Description",
+            "T Foo Description",
+            "I Foo Description",
+            "This is the label for the int empty value",
+        ),
+    ]
+
+
+def test_choice_label_order_by(db):
+    for value in ["bar", "foo", "bar"]:
+        MyModel.objects.create(c_field=value, c_field_nullable=value if value == "foo" else None)
+
+    qs = MyModel.objects.annotate(label=ChoiceLabel("c_field"))
+    assert list(qs.order_by("-label", "pk").values_list("c_field", flat=True)) == [
+        MyModel.TextEnum.C_FOO,
+        MyModel.TextEnum.C_BAR,
+        MyModel.TextEnum.C_BAR,
+    ]
+    assert list(
+        qs.values("label").annotate(count=models.Count("pk")).order_by("label"),
+    ) == [
+        {"label": "T Bar Description", "count": 2},
+        {"label": "T Foo Description", "count": 1},
+    ]
+
+    qs = MyModel.objects.annotate(label=ChoiceLabel("c_field_nullable", default="-"))
+    assert list(qs.order_by("pk").values_list("label", flat=True)) == [
+        "-",
+        "T Foo Description",
+        "-",
+    ]
+
+
+def test_choice_label_invalid_values(db):
+    obj = MyModel.objects.create()
+    MyModel.objects.filter(pk=obj.pk).update(c_field=models.Value("baz"))
+
+    assert MyModel.objects.values_list(ChoiceLabel("c_field"), flat=True).get() is None
+    assert MyModel.objects.values_list(ChoiceLabel("c_field", default="?"), flat=True).get() == "?"
+
+
+def test_choice_label_translated(db, monkeypatch):
+    monkeypatch.setattr(MyModel.TextEnum.C_FOO, "_label_", gettext_lazy("Yes"))
+    MyModel.objects.create(c_field=MyModel.TextEnum.C_FOO)
+
+    with translation.override("en"):
+        assert MyModel.objects.values_list(ChoiceLabel("c_field"), flat=True).get() == "Yes"
+    with translation.override("pt-br"):
+        assert MyModel.objects.values_list(ChoiceLabel("c_field"), flat=True).get() == "Sim"
+
+
+def test_choice_label_invalid_field(db):
+    with pytest.raises(TypeError, match="if_field is not a choices field with a label"):
+        list(MyModel.objects.annotate(label=ChoiceLabel("if_field")))
+
+    with pytest.raises(TypeError, match="id is not a choices field with a label"):
+        list(MyModel.objects.annotate(label=ChoiceLabel("id")))
+
+
+def test_choice_order(db):
+    for status in [Status.DONE, Status.NEW, Status.IN_PROGRESS, Status.NEW]:
+        OrderedModel.objects.create(status=status)
+
+    qs = OrderedModel.objects.order_by(ChoiceOrder("status"), "pk")
+    assert list(qs.values_list("status", flat=True)) == [
+        Status.NEW,
+        Status.NEW,
+        Status.IN_PROGRESS,
+        Status.DONE,
+    ]
+    assert list(qs[1:3].values_list("status", flat=True)) == [Status.NEW, Status.IN_PROGRESS]
+
+    qs = OrderedModel.objects.order_by(ChoiceOrder("status").desc(), "pk")
+    assert list(qs.values_list("status", flat=True)) == [
+        Status.DONE,
+        Status.IN_PROGRESS,
+        Status.NEW,
+        Status.NEW,
+    ]
+
+    qs = OrderedModel.objects.annotate(position=ChoiceOrder("status")).order_by("pk")
+    assert list(qs.values_list("position", flat=True)) == [2, 0, 1, 0]
+
+
+def test_choice_order_values(db):
+    MyModel.objects.create(c_field=MyModel.TextEnum.C_BAR, cc_field=MyModel.TextEnum.C_BAR)
+    MyModel.objects.create(i_field_nullable=MyModel.IntegerEnum.I_BAR)
+
+    rows = MyModel.objects.order_by("pk").values_list(
+        ChoiceOrder("c_field"),
+        ChoiceOrder("cc_field"),
+        ChoiceOrder("i_field_nullable"),
+        ChoiceOrder("i_field_nullable", default=-1),
+    )
+    assert list(rows) == [(1, 1, None, -1), (0, 0, 1, 1)]
+
+
+def test_choice_order_invalid_field(db):
+    with pytest.raises(TypeError, match="if_field is not a choices field with a position"):
+        list(MyModel.objects.order_by(ChoiceOrder("if_field")))
+
+
+def test_choice_label_and_order_escape_values(db):
+    for discount in [Discount.TENTH, Discount.FULL, Discount.HALF]:
+        DiscountModel.objects.create(discount=discount)
+
+    qs = DiscountModel.objects.order_by(ChoiceOrder("discount")).values_list(
+        "discount",
+        ChoiceLabel("discount"),
+        ChoiceOrder("discount"),
+    )
+    assert list(qs) == [
+        (Discount.HALF, "Half %s price", 0),
+        (Discount.FULL, "100%% off", 1),
+        (Discount.TENTH, "10% off", 2),
+    ]
+
+
+def test_choices_case_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        _ChoicesCase("status")  # type: ignore
+
+
+def test_choice_order_repr():
+    assert repr(ChoiceOrder("status")) == "ChoiceOrder('status')"
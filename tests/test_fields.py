@@ -1,10 +1,28 @@
+import gc
+import pickle
 import sys
+import weakref
+from pathlib import Path
 
 import pytest
+from django.contrib.admin.utils import display_for_field
 from django.core.exceptions import ImproperlyConfigured, ValidationError
-from django.db import models
-
+from django.db import connection, models
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.state import ProjectState
+from django.db.migrations.writer import MigrationWriter
+from django.utils import translation
+from django.utils.autoreload import file_changed
+
+from django_choices_field.choices import (
+    EnumChoices,
+    FlagChoices,
+    MemberLookup,
+    _translated_descriptions,
+    clear_translated_descriptions,
+)
 from django_choices_field.fields import (
+    CompactTextChoicesField,
     IntegerChoicesField,
     IntegerChoicesFlagField,
     TextChoicesField,
@@ -409,6 +427,62 @@ def test_integerchoices_field_with_choices_parameter():
     assert field.to_python(2).value == 2
 
 
+@pytest.mark.parametrize(
+    ("field_class", "choices", "values"),
+    [
+        (TextChoicesField, [("foo", "Foo"), ("bar", "Bar")], ["foo", "bar"]),
+        (IntegerChoicesField, [(1, "One"), (2, "Two")], [1, 2]),
+        (IntegerChoicesFlagField, [(1, "One"), (2, "Two"), (3, "One|Two")], [1, 2]),
+    ],
+)
+def test_field_with_choices_creates_enum_lazily(field_class, choices, values):
+    field = field_class(choices=choices)
+    assert "choices_enum" not in field.__dict__
+
+    choices_enum = field.choices_enum
+    assert [m.value for m in choices_enum] == values
+    assert field_class(choices=choices).choices_enum is choices_enum
+    assert field.clone().choices_enum is choices_enum
+    assert field_class(choices=choices[:1]).choices_enum is not choices_enum
+
+
+@pytest.mark.parametrize(
+    ("field_class", "choices", "integer_size"),
+    [
+        (IntegerChoicesField, [(1, "One"), (70000, "Big")], "regular"),
+        (IntegerChoicesFlagField, [(1, "One"), (2, "Two"), (3, "One|Two")], "small"),
+    ],
+)
+def test_field_with_choices_integer_size_doesnt_create_enum(field_class, choices, integer_size):
+    field = field_class(choices=choices, integer_size="auto")
+    assert field.integer_size == integer_size
+    assert "choices_enum" not in field.__dict__
+
+
+def test_field_with_choices_shared_enum_is_not_kept_alive():
+    choices = [("weak", "Weak")]
+    choices_enum = TextChoicesField(choices=choices).choices_enum
+    assert TextChoicesField(choices=choices).choices_enum is choices_enum
+
+    enum_ref = weakref.ref(choices_enum)
+    del choices_enum
+    gc.collect()
+    assert enum_ref() is None
+
+
+def test_field_with_lazy_choices_doesnt_share_enum():
+    choices = [("foo", translation.gettext_lazy("Foo"))]
+    assert TextChoicesField(choices=choices).choices_enum is not (
+        TextChoicesField(choices=choices).choices_enum
+    )
+
+
+def test_compact_text_field_with_choices_creates_enum_lazily():
+    field = CompactTextChoicesField(choices=[("foo", "Foo")], codes={"foo": 1})
+    assert "choices_enum" not in field.__dict__
+    assert field.get_prep_value("foo") == 1
+
+
 def test_textchoices_field_without_choices_or_enum_raises_error():
     with pytest.raises(TypeError) as exc:
         TextChoicesField()
@@ -428,3 +502,642 @@ def test_integerchoicesflag_field_without_choices_or_enum_raises_error():
         IntegerChoicesFlagField()
 
     assert str(exc.value) == "either of choices_enum or choices must be provided"
+
+
+def _make_flag_enum(size: int) -> type[IntegerChoicesFlag]:
+    return IntegerChoicesFlag(  # type: ignore
+        "ManyFlagsEnum",
+        [(f"F_{i}", (1 << i, f"Flag {i}")) for i in range(size)],
+    )
+
+
+def test_integerchoicesflag_field_choices_are_lazy():
+    ManyFlagsEnum = _make_flag_enum(24)  # noqa: N806
+
+    f = IntegerChoicesFlagField(choices_enum=ManyFlagsEnum)
+    assert isinstance(f.choices, FlagChoices)
+    assert len(f.choices) == 2**24 - 1
+    assert f.choices[0] == (1, "Flag 0")
+    assert f.choices[24] == (3, "Flag 0|Flag 1")
+
+    assert 1 in f.choices
+    assert 2**24 - 1 in f.choices
+    assert 0 not in f.choices
+    assert 2**24 not in f.choices
+    assert None not in f.choices
+    assert f.choices.get(5) == "Flag 0|Flag 2"
+    assert f.choices.get(2**24, "missing") == "missing"
+
+
+def test_flag_choices_decompose():
+    choices = FlagChoices(_make_flag_enum(4))
+    assert choices.decompose(1) == (1,)
+    assert choices.decompose(13) == (1, 4, 8)
+    assert choices.decompose(0) is None
+    assert choices.decompose(16) is None
+    assert choices.decompose("1") is None
+
+
+def test_flag_choices_caches_combinations():
+    choices = FlagChoices(_make_flag_enum(4))
+    assert choices.get(13) == "Flag 0|Flag 2|Flag 3"
+    assert choices.get(13) == "Flag 0|Flag 2|Flag 3"
+    assert 13 in choices
+
+    info = choices._get_combination.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+    # Iterating fills the cache with every combination when they all fit in it
+    list(choices)
+    assert choices._get_combination.cache_info().currsize == 11
+
+
+def test_flag_choices_cache_is_bounded():
+    class SmallCacheFlagChoices(FlagChoices):
+        cache_size = 4
+
+    choices = SmallCacheFlagChoices(_make_flag_enum(4))
+    for value in range(1, 16):
+        assert choices.get(value) is not None
+    assert choices._get_combination.cache_info().currsize == 4
+
+    # Too many combinations to go through the cache
+    assert len(list(choices)) == 15
+    assert choices._get_combination.cache_info().currsize == 4
+
+    # Nor to keep their expansion
+    flatchoices = choices.flatchoices
+    assert len(flatchoices) == 15
+    assert choices.flatchoices is not flatchoices
+
+
+def test_flag_choices_caches_translated_descriptions(settings):
+    enum = MyModel.IntegerFlagEnumTranslated
+    choices = MyModel._meta.get_field("ift_field").choices
+    assert isinstance(choices, FlagChoices)
+    clear_translated_descriptions()
+
+    label = choices.get(3)
+    with translation.override("en"):
+        assert str(label) == "IF Foo Description|IF Bar Description"
+    with translation.override("pt-br"):
+        assert str(label) == "IF Foo Description|IF Bar Description"
+    assert _translated_descriptions[enum] == {
+        (3, "en"): "IF Foo Description|IF Bar Description",
+        (3, "pt-br"): "IF Foo Description|IF Bar Description",
+    }
+
+    # Rendering it again in the same language is just a dict lookup
+    _translated_descriptions[enum][3, "en"] = "cached"
+    with translation.override("en"):
+        assert str(label) == "cached"
+
+    settings.LOCALE_PATHS = []
+    assert enum not in _translated_descriptions
+
+    str(label)
+    file_changed.send(sender=None, file_path=Path("locale/pt_BR/LC_MESSAGES/django.py"))
+    assert enum in _translated_descriptions
+    file_changed.send(sender=None, file_path=Path("locale/pt_BR/LC_MESSAGES/django.mo"))
+    assert enum not in _translated_descriptions
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        TextChoicesField(choices_enum=MyModel.TextEnum),
+        CompactTextChoicesField(choices_enum=MyModel.TextEnum, codes={"foo": 1, "bar": 2}),
+        IntegerChoicesField(choices_enum=MyModel.IntegerEnum, null=True),
+        IntegerChoicesFlagField(choices_enum=MyModel.IntegerFlagEnum),
+    ],
+)
+def test_unbound_field_pickle(field):
+    field.to_python(field.choices[0][0])
+    clone = pickle.loads(pickle.dumps(field))
+
+    assert clone.choices is field.choices
+    assert clone.choices_enum is field.choices_enum
+    assert clone.to_python(field.choices[0][0]) == field.choices_enum(field.choices[0][0])
+
+
+def test_choices_pickle_dead_enum():
+    class TemporaryEnum(models.TextChoices):
+        FOO = "foo", "Foo"
+
+    choices = EnumChoices(TemporaryEnum)
+    del TemporaryEnum
+    gc.collect()
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(choices)
+
+
+def test_fields_share_choices():
+    assert (
+        TextChoicesField(choices_enum=MyModel.TextEnum).choices
+        is MyModel._meta.get_field("c_field").choices
+    )
+    assert (
+        TextChoicesField(choices_enum=MyModel.TextEnum, null=True).choices
+        is MyModel._meta.get_field("c_field_nullable").choices
+    )
+    assert (
+        IntegerChoicesField(choices_enum=MyModel.IntegerEnum).choices
+        is MyModel._meta.get_field("i_field").choices
+    )
+    assert (
+        IntegerChoicesFlagField(choices_enum=MyModel.IntegerFlagEnum).choices
+        is MyModel._meta.get_field("if_field").choices
+    )
+
+    f = IntegerChoicesField(choices_enum=MyModel.IntegerEnum)
+    assert isinstance(f.choices, EnumChoices)
+    assert f.choices is not IntegerChoicesField(choices_enum=MyModel.IntegerEnum, null=True).choices
+
+
+def test_shared_choices_dont_keep_enum_alive():
+    ManyFlagsEnum = _make_flag_enum(4)  # noqa: N806
+    choices = IntegerChoicesFlagField(choices_enum=ManyFlagsEnum).choices
+    assert isinstance(choices, FlagChoices)
+    assert choices.choices_enum is ManyFlagsEnum
+
+    del ManyFlagsEnum
+    gc.collect()
+
+    assert choices.choices_enum is None
+    assert len(choices) == 15
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Requires Python 3.11+ to work properly")
+def test_int_flag_field_get_display_multiple(db):
+    m = MyModel(if_field=MyModel.IntegerFlagEnum.IF_FOO | MyModel.IntegerFlagEnum.IF_BIN)
+    assert m.get_if_field_display() == "IF Foo Description|IF Bin Description"
+
+    m = MyModel(ift_field=MyModel.IntegerFlagEnumTranslated.IF_BAR)
+    assert m.get_ift_field_display() == "IF Bar Description"
+
+    m = MyModel(ift_field=MyModel.IntegerFlagEnumTranslated(7))
+    assert m.get_ift_field_display() == ("IF Foo Description|IF Bar Description|IF Bin Description")
+
+
+def test_int_flag_field_flatchoices():
+    f = MyModel._meta.get_field("if_field")
+    flatchoices = f.flatchoices
+    assert list(flatchoices) == list(f.choices)
+    # Expanded once and shared by the fields using the same enum
+    assert f.flatchoices is flatchoices
+    assert MyModel._meta.get_field("if_field_with_empty_state").flatchoices is not flatchoices
+    assert IntegerChoicesFlagField(choices_enum=MyModel.IntegerFlagEnum).flatchoices is flatchoices
+
+    assert display_for_field(5, f, "-") == "IF Foo Description|IF Bin Description"
+    assert display_for_field(8, f, "-") == "-"
+
+    f = IntegerChoicesFlagField(choices=[(1, "Foo"), (2, "Bar")])
+    assert f.flatchoices == [(1, "Foo"), (2, "Bar")]
+
+
+def test_int_flag_field_validate():
+    f = MyModel._meta.get_field("if_field")
+    f.validate(MyModel.IntegerFlagEnum.IF_FOO, None)
+    f.validate(7, None)
+
+    with pytest.raises(ValidationError) as exc:
+        f.validate(8, None)
+    assert exc.value.code == "invalid_choice"
+
+    with pytest.raises(ValidationError) as exc:
+        f.validate(None, None)
+    assert exc.value.code == "null"
+
+
+@pytest.mark.parametrize("fname", ["c_field_nullable", "cc_field", "i_field", "if_field"])
+def test_field_deconstruct_does_not_change_field(monkeypatch, fname: str):
+    f = MyModel._meta.get_field(fname)
+    choices = f.choices
+    seen = []
+
+    deconstruct = models.Field.deconstruct
+
+    def spy(self):
+        # e.g. what other threads would see meanwhile
+        seen.append(f.choices)
+        return deconstruct(self)
+
+    monkeypatch.setattr(models.Field, "deconstruct", spy)
+    f.deconstruct()
+    assert seen == [choices]
+    assert f.choices is choices
+
+
+@pytest.mark.parametrize("fname", ["c_field_nullable", "cc_field", "i_field", "if_field"])
+def test_field_deconstruct_references_enum(fname: str):
+    f = MyModel._meta.get_field(fname)
+    _name, _path, args, kwargs = f.deconstruct()
+    assert "choices" not in kwargs
+    assert kwargs["choices_enum"] is f.choices_enum
+
+    clone = f.__class__(*args, **kwargs)
+    assert clone.choices is f.choices
+    assert clone.null == f.null
+
+    field_string, imports = MigrationWriter.serialize(f)
+    assert f"choices_enum=tests.models.MyModel.{f.choices_enum.__name__}" in field_string
+    assert "import tests.models" in imports
+
+
+def test_field_deconstruct_with_choices():
+    f = IntegerChoicesField(choices=[(1, "One"), (2, "Two")])
+    _name, _path, _args, kwargs = f.deconstruct()
+    assert kwargs["choices"] == [(1, "One"), (2, "Two")]
+    assert "choices_enum" not in kwargs
+
+
+@pytest.mark.parametrize("fname", ["c_field", "cc_field", "i_field", "if_field"])
+def test_field_deconstruct_upgrade_not_altered(fname: str):
+    # Migrations written before fields were deconstructed to their enum
+    f = MyModel._meta.get_field(fname)
+    _name, _path, args, kwargs = f.deconstruct()
+    del kwargs["choices_enum"]
+    old = f.__class__(*args, choices=list(f.choices), **kwargs)
+    old.set_attributes_from_name(fname)
+
+    assert not connection.schema_editor()._field_should_be_altered(old, f)
+
+
+def test_field_deconstruct_autodetector():
+    f = MyModel._meta.get_field("if_field")
+    autodetector = MigrationAutodetector(ProjectState(), ProjectState())
+    assert autodetector.deep_deconstruct(f) == autodetector.deep_deconstruct(f.clone())
+
+
+def test_int_flag_field_check_choices():
+    assert MyModel._meta.get_field("if_field").check() == []
+
+
+@pytest.mark.parametrize(
+    ("fname", "value", "expected"),
+    [
+        ("c_field", "bar", MyModel.TextEnum.C_BAR),
+        ("i_field", 2, MyModel.IntegerEnum.I_BAR),
+        ("i_field", "2", MyModel.IntegerEnum.I_BAR),
+        ("if_field", 4, MyModel.IntegerFlagEnum.IF_BIN),
+    ],
+)
+def test_to_python_uses_member_lookup(fname: str, value, expected):
+    f = MyModel._meta.get_field(fname)
+    member = f.to_python(value)
+    assert member is expected
+    assert f._member_lookup._members[expected.value] is expected
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Requires Python 3.11+ to work properly")
+def test_member_lookup_caches_flag_combinations():
+    lookup = MemberLookup(MyModel.IntegerFlagEnum)
+    assert 5 not in lookup._members
+
+    member = lookup(5)
+    assert member == MyModel.IntegerFlagEnum.IF_FOO | MyModel.IntegerFlagEnum.IF_BIN
+    assert lookup._members[5] is member
+    assert lookup(5) is member
+
+
+def test_member_lookup_invalid_value():
+    lookup = MemberLookup(MyModel.TextEnum)
+    with pytest.raises(ValueError):  # noqa: PT011
+        lookup("invalid")
+    with pytest.raises(ValueError):  # noqa: PT011
+        lookup(["unhashable"])
+
+    assert "invalid" not in lookup._members
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "expected"),
+    [
+        (TextChoicesField(MyModel.TextEnum, trusted_reads=True), "foo", MyModel.TextEnum.C_FOO),
+        (
+            IntegerChoicesField(MyModel.IntegerEnum, trusted_reads=True),
+            2,
+            MyModel.IntegerEnum.I_BAR,
+        ),
+        (
+            IntegerChoicesFlagField(MyModel.IntegerFlagEnum, trusted_reads=True),
+            2,
+            MyModel.IntegerFlagEnum.IF_BAR,
+        ),
+    ],
+)
+def test_trusted_reads_known_value(field, value, expected):
+    assert field.from_db_value(value, None, None) is expected
+    assert field.from_db_value(None, None, None) is None
+    assert field.from_db_values([value, None]) == [expected, None]
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        (TextChoicesField(MyModel.TextEnum, trusted_reads=True), "invalid"),
+        (IntegerChoicesField(MyModel.IntegerEnum, trusted_reads=True), 10),
+        (IntegerChoicesFlagField(MyModel.IntegerFlagEnum, trusted_reads=True), 8),
+    ],
+)
+def test_trusted_reads_unknown_value(field, value, caplog):
+    assert field.from_db_value(value, None, None) == value
+    assert field.from_db_values([value]) == [value]
+    assert f"{value!r} is not a valid" in caplog.text
+
+    field.trusted_reads = False
+    with pytest.raises(ValidationError):
+        field.from_db_value(value, None, None)
+
+
+@pytest.mark.parametrize(
+    "field_class",
+    [TextChoicesField, IntegerChoicesField, IntegerChoicesFlagField],
+)
+def test_trusted_reads_deconstruct(field_class):
+    enum = {
+        TextChoicesField: MyModel.TextEnum,
+        IntegerChoicesField: MyModel.IntegerEnum,
+        IntegerChoicesFlagField: MyModel.IntegerFlagEnum,
+    }[field_class]
+
+    _name, _path, _args, kwargs = field_class(enum).deconstruct()
+    assert "trusted_reads" not in kwargs
+
+    _name, _path, _args, kwargs = field_class(enum, trusted_reads=True).deconstruct()
+    assert kwargs["trusted_reads"] is True
+
+
+@pytest.mark.parametrize(
+    ("fname", "value", "expected"),
+    [
+        ("c_field", MyModel.TextEnum.C_BAR, "bar"),
+        ("c_field", "bar", "bar"),
+        ("c_field_nullable", None, None),
+        ("c_field_nullable", "", None),
+        ("i_field", MyModel.IntegerEnum.I_BAR, 2),
+        ("i_field", "2", 2),
+        ("i_field_nullable", None, None),
+        ("if_field", MyModel.IntegerFlagEnum.IF_BIN, 4),
+        ("if_field", 4, 4),
+        ("if_field_nullable", None, None),
+    ],
+)
+def test_get_prep_value_returns_primitive(fname: str, value, expected):
+    prep_value = MyModel._meta.get_field(fname).get_prep_value(value)
+    assert prep_value == expected
+    assert type(prep_value) is type(expected)
+
+
+def test_text_field_get_prep_value_converts_once(monkeypatch):
+    f = TextChoicesField(choices_enum=MyModel.TextEnum)
+    calls = []
+    to_python = f.to_python
+    monkeypatch.setattr(f, "to_python", lambda value: calls.append(value) or to_python(value))
+
+    assert f.get_prep_value("bar") == "bar"
+    assert calls == ["bar"]
+
+
+def test_update_and_filter_with_members(db):
+    m = MyModel.objects.create()
+
+    MyModel.objects.update(c_field=MyModel.TextEnum.C_BAR, i_field=MyModel.IntegerEnum.I_BAR)
+    assert (
+        MyModel.objects.filter(
+            c_field=MyModel.TextEnum.C_BAR,
+            i_field__in=[MyModel.IntegerEnum.I_BAR],
+        ).get()
+        == m
+    )
+
+
+def test_compact_text_field_choices():
+    f = MyModel._meta.get_field("cc_field")
+    assert f.choices == [
+        ("foo", "T Foo Description"),
+        ("bar", "T Bar Description"),
+    ]
+    assert f.codes == {"foo": 1, "bar": 2}
+    assert f.db_type(connection) == "smallint unsigned"
+
+
+def test_compact_text_field_stores_codes(db):
+    m = MyModel.objects.create(cc_field=MyModel.TextEnum.C_BAR, cc_field_nullable="foo")
+    assert m.cc_field == MyModel.TextEnum.C_BAR
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT cc_field, cc_field_nullable FROM {MyModel._meta.db_table}")
+        assert cursor.fetchone() == (2, 1)
+
+    m = MyModel.objects.get(pk=m.pk)
+    assert m.cc_field is MyModel.TextEnum.C_BAR
+    assert m.cc_field_nullable is MyModel.TextEnum.C_FOO
+    assert m.get_cc_field_display() == "T Bar Description"
+
+    assert MyModel.objects.filter(cc_field="bar").count() == 1
+    assert MyModel.objects.filter(cc_field__in=[MyModel.TextEnum.C_FOO]).count() == 0
+    assert list(MyModel.choices_objects.values_list("cc_field", flat=True)) == [
+        MyModel.TextEnum.C_BAR,
+    ]
+
+    m.cc_field_nullable = None
+    m.save()
+    assert MyModel.objects.get(pk=m.pk).cc_field_nullable is None
+
+
+def test_compact_text_field_clean():
+    f = MyModel._meta.get_field("cc_field")
+    assert f.clean("bar", None) is MyModel.TextEnum.C_BAR
+
+    with pytest.raises(ValidationError):
+        f.clean("invalid", None)
+
+
+def test_compact_text_field_invalid_code():
+    f = MyModel._meta.get_field("cc_field")
+    with pytest.raises(ValidationError):
+        f.from_db_value(10, None, None)
+
+    f = CompactTextChoicesField(MyModel.TextEnum, codes={"foo": 1, "bar": 2}, trusted_reads=True)
+    assert f.from_db_value(2, None, None) is MyModel.TextEnum.C_BAR
+    assert f.from_db_value(10, None, None) == 10
+
+
+def test_compact_text_field_deconstruct():
+    f = MyModel._meta.get_field("cc_field")
+    _name, path, _args, kwargs = f.deconstruct()
+    assert path == "django_choices_field.fields.CompactTextChoicesField"
+    assert kwargs["codes"] == {"foo": 1, "bar": 2}
+
+    clone = f.clone()
+    assert clone.codes == f.codes
+    assert clone.get_prep_value("bar") == 2
+
+
+@pytest.mark.parametrize(
+    ("codes", "message"),
+    [
+        (None, "codes must be provided"),
+        ({"foo": 1}, "CompactTextChoicesField is missing codes for: bar."),
+        (
+            {"foo": 1, "bar": 2, "baz": 3},
+            "CompactTextChoicesField has codes for unknown values: baz.",
+        ),
+        ({"foo": 1, "bar": 1}, "CompactTextChoicesField codes must be unique."),
+        ({"foo": 1, "bar": 40000}, "CompactTextChoicesField codes must be between 0 and 32767."),
+    ],
+)
+def test_compact_text_field_invalid_codes(codes, message):
+    with pytest.raises((TypeError, ImproperlyConfigured)) as exc:
+        CompactTextChoicesField(MyModel.TextEnum, codes=codes)
+
+    assert str(exc.value) == message
+
+
+def _make_int_enum(*values: int) -> type[models.IntegerChoices]:
+    return models.IntegerChoices("SizedEnum", [(f"V_{i}", v) for i, v in enumerate(values)])
+
+
+@pytest.mark.parametrize(
+    ("values", "internal_type"),
+    [
+        ((0, 5), "SmallIntegerField"),
+        ((-(2**15), 2**15 - 1), "SmallIntegerField"),
+        ((0, 2**15), "IntegerField"),
+        ((-(2**31), 1), "IntegerField"),
+        ((0, 2**31), "BigIntegerField"),
+    ],
+)
+def test_integer_field_auto_size(values, internal_type):
+    f = IntegerChoicesField(_make_int_enum(*values), integer_size="auto")
+    assert f.get_internal_type() == internal_type
+
+    _name, _path, _args, kwargs = f.deconstruct()
+    assert kwargs["integer_size"] in {"small", "regular", "big"}
+    assert f.clone().get_internal_type() == internal_type
+
+
+def test_integer_field_default_size():
+    f = MyModel._meta.get_field("i_field")
+    assert f.integer_size is None
+    assert f.get_internal_type() == "IntegerField"
+    assert "integer_size" not in f.deconstruct()[3]
+
+
+def test_integer_field_size_db_type():
+    f = IntegerChoicesField(MyModel.IntegerEnum, integer_size="auto")
+    assert f.db_type(connection) == "smallint"
+    assert f.clean(MyModel.IntegerEnum.I_BAR, None) == MyModel.IntegerEnum.I_BAR
+
+
+def test_integer_field_size_too_small():
+    with pytest.raises(ImproperlyConfigured) as exc:
+        IntegerChoicesField(_make_int_enum(1, 2**15), integer_size="small")
+
+    assert str(exc.value) == (
+        "IntegerChoicesField values range from 1 to 32768, "
+        "which doesn't fit in a small integer column."
+    )
+
+
+def test_integer_field_size_invalid():
+    with pytest.raises(ImproperlyConfigured) as exc:
+        IntegerChoicesField(MyModel.IntegerEnum, integer_size="tiny")
+
+    assert str(exc.value) == (
+        "IntegerChoicesField integer_size must be one of: auto, small, regular, big."
+    )
+
+
+def test_integerchoicesflag_field_auto_size():
+    f = IntegerChoicesFlagField(MyModel.IntegerFlagEnum, integer_size="auto")
+    assert f.integer_size == "small"
+    assert f.get_internal_type() == "SmallIntegerField"
+
+    f = IntegerChoicesFlagField(_make_flag_enum(16), integer_size="auto")
+    assert f.integer_size == "regular"
+
+    f = IntegerChoicesFlagField(_make_flag_enum(40), integer_size="auto")
+    assert f.integer_size == "big"
+
+    with pytest.raises(ImproperlyConfigured) as exc:
+        IntegerChoicesFlagField(_make_flag_enum(64), integer_size="auto")
+
+    assert str(exc.value) == (
+        f"IntegerChoicesFlagField values range from 1 to {2**64 - 1}, "
+        "which doesn't fit in any integer column."
+    )
+
+
+def test_text_field_validate_many():
+    f = MyModel._meta.get_field("c_field")
+    result = f.validate_many(["foo", "bar", "invalid", None, "", ["foo"], "foo"])
+    assert result.members == [
+        MyModel.TextEnum.C_FOO,
+        MyModel.TextEnum.C_BAR,
+        None,
+        None,
+        None,
+        None,
+        MyModel.TextEnum.C_FOO,
+    ]
+    assert result.invalid == [2, 3, 4, 5]
+
+
+def test_integer_field_validate_many():
+    f = MyModel._meta.get_field("i_field")
+    result = f.validate_many(iter([1, "2", 3, "x", MyModel.IntegerEnum.I_BAR]))
+    assert result.members == [
+        MyModel.IntegerEnum.I_FOO,
+        MyModel.IntegerEnum.I_BAR,
+        None,
+        None,
+        MyModel.IntegerEnum.I_BAR,
+    ]
+    assert result.invalid == [2, 3]
+
+    assert f.validate_many([1, 2]) == ([MyModel.IntegerEnum.I_FOO, MyModel.IntegerEnum.I_BAR], [])
+
+
+def test_validate_many_empty_values():
+    # Empty values are only valid when the field is both null and blank, like clean()
+    assert MyModel._meta.get_field("i_field_nullable").validate_many([None]).invalid == [0]
+
+    f = IntegerChoicesField(choices_enum=MyModel.IntegerEnum, null=True, blank=True)
+    assert f.validate_many([None, 1]) == ([None, MyModel.IntegerEnum.I_FOO], [])
+
+
+def test_flag_field_validate_many():
+    f = MyModel._meta.get_field("if_field")
+    result = f.validate_many([1, 7, "5", 8, 0])
+    assert result.members == [
+        MyModel.IntegerFlagEnum.IF_FOO,
+        MyModel.IntegerFlagEnum(7),
+        MyModel.IntegerFlagEnum(5),
+        None,
+        None,
+    ]
+    assert result.invalid == [3, 4]
+
+
+def test_flag_field_validate_many_cached_invalid():
+    f = MyModel._meta.get_field("if_field")
+    # 0 is accepted by the enum when read from the database, but is not a valid choice
+    assert f.from_db_value(0, None, None) == MyModel.IntegerFlagEnum(0)
+    assert f.validate_many([0, 1]).invalid == [0]
+
+
+def test_compact_text_field_validate_many():
+    f = MyModel._meta.get_field("cc_field")
+    assert f.validate_many(["bar", 1]) == ([MyModel.TextEnum.C_BAR, None], [1])
+
+
+def test_validate_many_runs_custom_validators():
+    def validate_not_bar(value):
+        if value == "bar":
+            raise ValidationError("bar is not allowed")
+
+    f = TextChoicesField(choices_enum=MyModel.TextEnum, validators=[validate_not_bar])
+    assert f.validate_many(["foo", "bar"]) == ([MyModel.TextEnum.C_FOO, None], [1])
@@ -0,0 +1,89 @@
+from django import forms
+
+from django_choices_field.fields import IntegerChoicesFlagField
+from django_choices_field.forms import FlagCheckboxSelectMultiple, IntegerChoicesFlagFormField
+from django_choices_field.types import IntegerChoicesFlag
+
+from .models import MyModel
+
+
+class FlagsForm(forms.ModelForm):
+    class Meta:
+        model = MyModel
+        fields = ("if_field",)
+
+
+def test_formfield():
+    f = MyModel._meta.get_field("if_field").formfield()
+    assert isinstance(f, IntegerChoicesFlagFormField)
+    assert isinstance(f.widget, FlagCheckboxSelectMultiple)
+    assert f.required
+    assert f.initial == MyModel.IntegerFlagEnum.IF_FOO
+    assert list(f.choices) == [
+        (1, "IF Foo Description"),
+        (2, "IF Bar Description"),
+        (4, "IF Bin Description"),
+    ]
+
+    f = IntegerChoicesFlagField(choices_enum=MyModel.IntegerFlagEnum, null=True, blank=True)
+    assert not f.formfield().required
+    assert f.formfield().clean([]) is None
+
+
+def test_formfield_with_choices():
+    f = IntegerChoicesFlagField(choices=[(1, "One"), (2, "Two"), (3, "One|Two")]).formfield()
+    assert isinstance(f, forms.TypedChoiceField)
+
+
+def test_get_choices():
+    f = MyModel._meta.get_field("if_field")
+    assert f.get_choices() == [
+        ("", "---------"),
+        (1, "IF Foo Description"),
+        (2, "IF Bar Description"),
+        (4, "IF Bin Description"),
+    ]
+    assert f.get_choices(include_blank=False)[0] == (1, "IF Foo Description")
+
+
+def test_form_renders_checkboxes():
+    form = FlagsForm(instance=MyModel(if_field=MyModel.IntegerFlagEnum(5)))
+    html = str(form["if_field"])
+    assert html.count('type="checkbox"') == 3
+    assert html.count("checked") == 2
+    assert 'value="1" ' in html
+    assert 'value="4" ' in html
+
+
+def test_form_renders_linearly():
+    ManyFlagsEnum = IntegerChoicesFlag(  # noqa: N806 # type: ignore
+        "ManyFlagsEnum",
+        [(f"F_{i}", (1 << i, f"Flag {i}")) for i in range(16)],
+    )
+    f = IntegerChoicesFlagField(choices_enum=ManyFlagsEnum).formfield()
+    html = f.widget.render("flags", ManyFlagsEnum(2**16 - 1))
+    assert html.count('type="checkbox"') == 16
+    assert html.count("checked") == 16
+
+
+def test_form_clean():
+    form = FlagsForm(data={"if_field": ["1", "4"]})
+    assert form.is_valid(), form.errors
+    assert form.cleaned_data["if_field"] == MyModel.IntegerFlagEnum(5)
+    assert isinstance(form.cleaned_data["if_field"], MyModel.IntegerFlagEnum)
+
+
+def test_form_clean_invalid():
+    form = FlagsForm(data={"if_field": ["8"]})
+    assert not form.is_valid()
+    assert form.errors["if_field"][0].startswith("Select a valid choice.")
+
+    form = FlagsForm(data={})
+    assert not form.is_valid()
+    assert form.errors["if_field"] == ["This field is required."]
+
+
+def test_form_has_changed():
+    instance = MyModel(if_field=MyModel.IntegerFlagEnum(5))
+    assert not FlagsForm(data={"if_field": ["4", "1"]}, instance=instance).has_changed()
+    assert FlagsForm(data={"if_field": ["1"]}, instance=instance).has_changed()
@@ -0,0 +1,119 @@
+import pytest
+from django.core import checks
+from django.core.checks.model_checks import check_all_models
+from django.db import connection, models
+
+from django_choices_field.expressions import ChoiceOrder
+from django_choices_field.indexes import get_flag_indexes
+
+from .models import (
+    DiscountModel,
+    IndexedFlagModel,
+    IndexedFlagModelArchive,
+    MyModel,
+    OrderedModel,
+)
+
+
+def test_get_flag_indexes_functional():
+    indexes = get_flag_indexes("flags", MyModel.IntegerFlagEnum)
+    # Named once the model is declared
+    assert [i.name for i in indexes] == ["", "", ""]
+    assert all(len(i.expressions) == 1 for i in indexes)
+    assert all(i.condition is None for i in indexes)
+
+
+def test_get_flag_indexes_partial():
+    indexes = get_flag_indexes(
+        "flags",
+        MyModel.IntegerFlagEnum,
+        fields=["id"],
+        name_prefix="p",
+        db_tablespace="foo",
+    )
+    assert [i.name for i in indexes] == ["p_0", "p_1", "p_2"]
+    assert [i.fields for i in indexes] == [["id"]] * 3
+    assert [i.condition for i in indexes] == [
+        models.Q(flags__has_any=1),
+        models.Q(flags__has_any=2),
+        models.Q(flags__has_any=4),
+    ]
+    assert all(i.db_tablespace == "foo" for i in indexes)
+
+
+def test_get_flag_indexes_name_length(monkeypatch):
+    monkeypatch.setattr(IndexedFlagModel._meta, "db_table", "a_long_app_label_averylongmodelname")
+    indexes = get_flag_indexes("flags_nullable", MyModel.IntegerFlagEnum)
+    for index in indexes:
+        index.set_name_with_model(IndexedFlagModel)
+
+    names = [i.name for i in indexes]
+    assert all(len(name) <= 30 for name in names)
+    assert names[0] == "a_long_app__flags_n_dd93d4_0"
+
+
+def test_get_flag_indexes_unique_among_models():
+    # Both tables start with the same 11 characters
+    assert [i.name for i in IndexedFlagModel._meta.indexes][:3] == [
+        "tests_index_flags_67328a_0",
+        "tests_index_flags_94c1cf_1",
+        "tests_index_flags_aab581_2",
+    ]
+    assert [i.name for i in IndexedFlagModelArchive._meta.indexes] == [
+        "tests_index_flags_816035_0",
+        "tests_index_flags_164b4c_1",
+        "tests_index_flags_fa3aa4_2",
+    ]
+    assert [e for e in check_all_models() if e.level >= checks.ERROR] == []
+
+
+def test_get_flag_indexes_deconstruct():
+    index = IndexedFlagModel._meta.indexes[0]
+    path, _args, kwargs = index.deconstruct()
+    assert path == "django.db.models.Index"
+    assert kwargs["name"] == "tests_index_flags_67328a_0"
+    assert type(index.clone()) is models.Index
+
+
+def test_get_flag_indexes_checks():
+    assert [e for e in IndexedFlagModel.check() if e.level >= checks.ERROR] == []
+
+
+def _explain(qs):
+    sql, params = qs.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return " ".join(str(row) for row in cursor.fetchall())
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="Uses SQLite's EXPLAIN QUERY PLAN")
+def test_get_flag_indexes_partial_are_used(db):
+    IndexedFlagModel.objects.create(flags=MyModel.IntegerFlagEnum.IF_BAR)
+
+    qs = IndexedFlagModel.objects.filter(flags__has_any=MyModel.IntegerFlagEnum.IF_BAR)
+    assert list(qs.values_list("flags", flat=True)) == [MyModel.IntegerFlagEnum.IF_BAR]
+
+    qs = IndexedFlagModel.objects.filter(flags_nullable__has_any=MyModel.IntegerFlagEnum.IF_BIN)
+    assert "flags_null_2" in _explain(qs)
+
+
+def test_flag_lookups_inline_mask():
+    sql, params = IndexedFlagModel.objects.filter(flags__has_any=2).query.sql_with_params()
+    assert '("tests_indexedflagmodel"."flags" & 2) <> 0' in sql
+    assert params == ()
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="Uses SQLite's EXPLAIN QUERY PLAN")
+@pytest.mark.parametrize(
+    ("model", "field_name", "index_name"),
+    [
+        (OrderedModel, "status", "status_order"),
+        # Values with % in them, which are escaped when inlined
+        (DiscountModel, "discount", "discount_order"),
+    ],
+)
+def test_choice_order_index_is_used(db, model, field_name: str, index_name: str):
+    assert [e for e in model.check() if e.level >= checks.ERROR] == []
+
+    qs = model.objects.order_by(ChoiceOrder(field_name))[:10]
+    assert index_name in _explain(qs)
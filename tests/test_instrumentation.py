@@ -0,0 +1,140 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+
+from django_choices_field import instrumentation
+from django_choices_field.choices import MemberLookup
+from django_choices_field.fields import IntegerChoicesField
+from django_choices_field.instrumentation import Counters, add_listener, remove_listener
+
+from .models import MyModel
+
+
+class StatsdStandIn:
+    def __init__(self):
+        self.calls = []
+
+    def incr(self, name, count=1):
+        self.calls.append(("incr", name, count))
+
+    def timing(self, name, ms):
+        self.calls.append(("timing", name, ms))
+
+
+@pytest.fixture
+def counters():
+    listener = Counters()
+    add_listener(listener)
+    yield listener
+    remove_listener(listener)
+
+
+def test_disabled_by_default():
+    assert MemberLookup.__call__ is instrumentation._original_call
+    assert MemberLookup.find is instrumentation._original_find
+    assert MemberLookup.get is instrumentation._original_get
+    assert MemberLookup.map is instrumentation._original_map
+    assert MemberLookup.reject is instrumentation._original_reject
+
+
+def test_listener_enables_and_disables():
+    listener = Counters()
+    add_listener(listener)
+    try:
+        assert MemberLookup.__call__ is instrumentation._instrumented_call
+    finally:
+        remove_listener(listener)
+
+    assert MemberLookup.__call__ is instrumentation._original_call
+    assert instrumentation._timing is False
+
+
+def test_counts_conversions(counters):
+    f = MyModel._meta.get_field("if_field")
+    f.to_python(MyModel.IntegerFlagEnum.IF_FOO)
+    f.to_python(7)
+    f.to_python(7)
+    with pytest.raises(ValidationError):
+        f.to_python(8)
+
+    key = "tests.models.MyModel.IntegerFlagEnum"
+    snapshot = counters.snapshot()
+    assert snapshot[instrumentation.CONVERSION, key] == (3, 0.0)
+    assert snapshot[instrumentation.CACHE_HIT, key][0] >= 2
+    assert snapshot[instrumentation.VALIDATION_FAILURE, key] == (1, 0.0)
+
+
+def test_counts_trusted_and_batch_conversions(counters):
+    f = MyModel._meta.get_field("c_field")
+    f.from_db_value("foo", None, connection)
+    f.from_db_values(["foo", "bar", None])
+
+    trusted = IntegerChoicesField(choices_enum=MyModel.IntegerEnum, trusted_reads=True)
+    assert trusted.from_db_value(5, None, connection) == 5
+    assert trusted.from_db_values([1, 2]) == [MyModel.IntegerEnum.I_FOO, MyModel.IntegerEnum.I_BAR]
+
+    assert counters.snapshot(reset=True) == {
+        (instrumentation.CACHE_HIT, "tests.models.MyModel.TextEnum"): (3, 0.0),
+        (instrumentation.CONVERSION, "tests.models.MyModel.TextEnum"): (3, 0.0),
+        (instrumentation.CACHE_HIT, "tests.models.MyModel.IntegerEnum"): (2, 0.0),
+        (instrumentation.CONVERSION, "tests.models.MyModel.IntegerEnum"): (2, 0.0),
+        (instrumentation.VALIDATION_FAILURE, "tests.models.MyModel.IntegerEnum"): (1, 0.0),
+    }
+    assert counters.snapshot() == {}
+
+
+def test_counts_validate_many(counters):
+    f = MyModel._meta.get_field("i_field")
+    result = f.validate_many([1, "2", 3, "x", MyModel.IntegerEnum.I_BAR])
+    assert result.invalid == [2, 3]
+
+    assert counters.snapshot() == {
+        (instrumentation.CACHE_HIT, "tests.models.MyModel.IntegerEnum"): (3, 0.0),
+        (instrumentation.CONVERSION, "tests.models.MyModel.IntegerEnum"): (3, 0.0),
+        (instrumentation.VALIDATION_FAILURE, "tests.models.MyModel.IntegerEnum"): (2, 0.0),
+    }
+
+
+def test_timing_exported_to_statsd():
+    statsd = StatsdStandIn()
+
+    def listener(event, choices_enum, count, duration):
+        name = f"choices.{choices_enum.__qualname__}.{event}"
+        statsd.incr(name, count)
+        if duration is not None:
+            statsd.timing(name, duration * 1000)
+
+    add_listener(listener, timing=True)
+    try:
+        MyModel._meta.get_field("i_field").to_python(1)
+    finally:
+        remove_listener(listener)
+
+    assert [c[:2] for c in statsd.calls] == [
+        ("incr", "choices.MyModel.IntegerEnum.cache_hit"),
+        ("incr", "choices.MyModel.IntegerEnum.conversion"),
+        ("timing", "choices.MyModel.IntegerEnum.conversion"),
+    ]
+    assert statsd.calls[2][2] >= 0
+
+
+def test_timing_only_for_timing_listeners():
+    durations = {"timing": [], "plain": []}
+
+    def timing_listener(event, choices_enum, count, duration):
+        durations["timing"].append(duration)
+
+    def plain_listener(event, choices_enum, count, duration):
+        durations["plain"].append(duration)
+
+    add_listener(timing_listener, timing=True)
+    add_listener(plain_listener)
+    try:
+        MyModel._meta.get_field("i_field").to_python(1)
+    finally:
+        remove_listener(timing_listener)
+        remove_listener(plain_listener)
+
+    assert durations["timing"][0] is None
+    assert durations["timing"][1] >= 0
+    assert durations["plain"] == [None, None]
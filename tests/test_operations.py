@@ -0,0 +1,186 @@
+import pytest
+from django.db import NotSupportedError, connection, models
+from django.test.utils import isolate_apps
+
+from django_choices_field import fields
+from django_choices_field.fields import TextChoicesField, _check_db_enum_types
+from django_choices_field.operations import (
+    AlterEnumType,
+    CreateEnumType,
+    get_migrated_enum_types,
+)
+
+from .models import MyModel
+
+
+class PostgresOps:
+    def quote_name(self, name):
+        return f'"{name}"'
+
+
+class PostgresConnection:
+    vendor = "postgresql"
+    ops = PostgresOps()
+
+
+class PostgresSchemaEditor:
+    connection = PostgresConnection()
+
+    def __init__(self):
+        self.executed = []
+
+    def quote_name(self, name):
+        return f'"{name}"'
+
+    def quote_value(self, value):
+        return "'{}'".format(value.replace("'", "''"))
+
+    def execute(self, sql, params=()):
+        self.executed.append(sql)
+
+
+def test_text_field_db_enum_type():
+    f = TextChoicesField(MyModel.TextEnum, db_enum_type="text_enum")
+    assert f.db_type(PostgresConnection()) == '"text_enum"'
+    assert f.db_type(connection) == "varchar(3)"
+
+    _name, _path, _args, kwargs = f.deconstruct()
+    assert kwargs["db_enum_type"] == "text_enum"
+
+    f = TextChoicesField(MyModel.TextEnum)
+    assert "db_enum_type" not in f.deconstruct()[3]
+
+
+def test_create_enum_type():
+    operation = CreateEnumType("text_enum", MyModel.TextEnum)
+    assert operation.values == ["foo", "bar"]
+    assert operation.deconstruct() == ("CreateEnumType", ["text_enum", ["foo", "bar"]], {})
+    assert operation.describe() == "Create enum type text_enum"
+    assert operation.migration_name_fragment == "create_enum_text_enum"
+
+    schema_editor = PostgresSchemaEditor()
+    operation.database_forwards("tests", schema_editor, None, None)
+    assert schema_editor.executed == ["""CREATE TYPE "text_enum" AS ENUM ('foo', 'bar')"""]
+
+    schema_editor = PostgresSchemaEditor()
+    operation.database_backwards("tests", schema_editor, None, None)
+    assert schema_editor.executed == ['DROP TYPE "text_enum"']
+
+
+def test_alter_enum_type():
+    operation = AlterEnumType("text_enum", ["foo", "bar", "baz"])
+    assert operation.deconstruct() == ("AlterEnumType", ["text_enum", ["foo", "bar", "baz"]], {})
+    assert operation.describe() == "Alter enum type text_enum"
+    assert operation.migration_name_fragment == "alter_enum_text_enum"
+
+    schema_editor = PostgresSchemaEditor()
+    operation.database_forwards("tests", schema_editor, None, None)
+    assert schema_editor.executed == [
+        """ALTER TYPE "text_enum" ADD VALUE IF NOT EXISTS 'foo'""",
+        """ALTER TYPE "text_enum" ADD VALUE IF NOT EXISTS 'bar'""",
+        """ALTER TYPE "text_enum" ADD VALUE IF NOT EXISTS 'baz'""",
+    ]
+
+    with pytest.raises(NotSupportedError):
+        operation.database_backwards("tests", schema_editor, None, None)
+
+
+def test_get_migrated_enum_types(settings):
+    settings.MIGRATION_MODULES = {"tests": "tests.enum_types.migrations"}
+    assert get_migrated_enum_types() == {"text_enum": {"foo", "bar"}, "other_enum": {"foo", "bar"}}
+
+
+def test_text_field_db_enum_type_check(settings):
+    settings.MIGRATION_MODULES = {"tests": "tests.enum_types.migrations"}
+    enum_types = get_migrated_enum_types()
+
+    f = TextChoicesField(MyModel.TextEnum, db_enum_type="text_enum")
+    assert f._check_db_enum_type(enum_types) == []
+
+    class BazEnum(models.TextChoices):
+        FOO = "foo", "Foo"
+        BAZ = "baz", "Baz"
+
+    errors = TextChoicesField(BazEnum, db_enum_type="text_enum")._check_db_enum_type(enum_types)
+    assert [(e.id, e.msg) for e in errors] == [
+        (
+            "django_choices_field.W002",
+            (
+                "The enum type text_enum is missing values of "
+                "test_text_field_db_enum_type_check.<locals>.BazEnum: baz."
+            ),
+        ),
+    ]
+
+    f = TextChoicesField(MyModel.TextEnum, db_enum_type="unknown_enum")
+    errors = f._check_db_enum_type(enum_types)
+    assert [(e.id, e.msg) for e in errors] == [
+        (
+            "django_choices_field.W001",
+            "The enum type unknown_enum is not created by any migration.",
+        ),
+    ]
+
+    assert TextChoicesField(MyModel.TextEnum)._check_db_enum_type(enum_types) == []
+
+
+def test_db_enum_types_check_loads_migrations_once(settings, monkeypatch):
+    settings.MIGRATION_MODULES = {"tests": "tests.enum_types.migrations"}
+    calls = []
+
+    def get_enum_types():
+        calls.append(None)
+        return get_migrated_enum_types()
+
+    monkeypatch.setattr(fields, "get_migrated_enum_types", get_enum_types)
+
+    with isolate_apps("tests") as apps:
+        app_configs = [apps.get_app_config("tests")]
+
+        class PlainModel(models.Model):
+            text_field = TextChoicesField(MyModel.TextEnum)
+
+        assert _check_db_enum_types(app_configs) == []
+        assert calls == []
+
+        class EnumTypeModel(models.Model):
+            text_field = TextChoicesField(MyModel.TextEnum, db_enum_type="text_enum")
+            other_field = TextChoicesField(MyModel.TextEnum, db_enum_type="other_enum")
+            unknown_field = TextChoicesField(MyModel.TextEnum, db_enum_type="unknown_enum")
+
+        errors = _check_db_enum_types(app_configs)
+
+    assert [(e.id, e.obj) for e in errors] == [
+        ("django_choices_field.W001", EnumTypeModel._meta.get_field("unknown_field")),
+    ]
+    assert len(calls) == 1
+
+
+def test_db_enum_types_check_broken_migrations(settings):
+    settings.MIGRATION_MODULES = {"tests": "tests.enum_types.broken.migrations"}
+
+    with isolate_apps("tests") as apps:
+
+        class EnumTypeModel(models.Model):
+            text_field = TextChoicesField(MyModel.TextEnum, db_enum_type="text_enum")
+
+        errors = _check_db_enum_types([apps.get_app_config("tests")])
+
+    assert [e.id for e in errors] == ["django_choices_field.W003"]
+    assert "0000_missing" in errors[0].msg
+
+
+def test_enum_type_operations_noop_on_other_databases(transactional_db):
+    with connection.schema_editor() as schema_editor:
+        CreateEnumType("text_enum", MyModel.TextEnum).database_forwards(
+            "tests",
+            schema_editor,
+            None,
+            None,
+        )
+        AlterEnumType("text_enum", ["foo", "bar"]).database_forwards(
+            "tests",
+            schema_editor,
+            None,
+            None,
+        )
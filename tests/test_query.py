@@ -0,0 +1,138 @@
+import sys
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import F
+
+from django_choices_field.query import ChoicesQuery
+
+from .models import MyModel
+
+
+def _create_objects():
+    MyModel.objects.create(
+        c_field=MyModel.TextEnum.C_BAR,
+        i_field=MyModel.IntegerEnum.I_BAR,
+        if_field=MyModel.IntegerFlagEnum.IF_BIN,
+    )
+    MyModel.objects.create(
+        c_field_nullable=MyModel.TextEnum.C_FOO,
+        i_field_nullable=MyModel.IntegerEnum.I_FOO,
+        if_field_nullable=MyModel.IntegerFlagEnum.IF_BAR,
+    )
+
+
+def test_queryset_uses_choices_query():
+    assert isinstance(MyModel.choices_objects.all().query, ChoicesQuery)
+    assert isinstance(MyModel.choices_objects.filter(pk=1).values().query, ChoicesQuery)
+
+
+def test_queryset_hydrates_models(db):
+    _create_objects()
+
+    objs = list(MyModel.choices_objects.order_by("pk"))
+    assert [o.c_field for o in objs] == [MyModel.TextEnum.C_BAR, MyModel.TextEnum.C_FOO]
+    assert all(isinstance(o.c_field, MyModel.TextEnum) for o in objs)
+    assert [o.c_field_nullable for o in objs] == [None, MyModel.TextEnum.C_FOO]
+    assert [o.i_field for o in objs] == [MyModel.IntegerEnum.I_BAR, MyModel.IntegerEnum.I_FOO]
+    assert all(isinstance(o.i_field, MyModel.IntegerEnum) for o in objs)
+    assert [o.i_field_nullable for o in objs] == [None, MyModel.IntegerEnum.I_FOO]
+    assert [o.if_field for o in objs] == [
+        MyModel.IntegerFlagEnum.IF_BIN,
+        MyModel.IntegerFlagEnum.IF_FOO,
+    ]
+    assert all(isinstance(o.if_field, MyModel.IntegerFlagEnum) for o in objs)
+    assert [o.if_field_nullable for o in objs] == [None, MyModel.IntegerFlagEnum.IF_BAR]
+
+
+def test_queryset_hydrates_values(db):
+    _create_objects()
+
+    values = list(MyModel.choices_objects.order_by("pk").values("c_field", "i_field"))
+    assert values == [
+        {"c_field": MyModel.TextEnum.C_BAR, "i_field": MyModel.IntegerEnum.I_BAR},
+        {"c_field": MyModel.TextEnum.C_FOO, "i_field": MyModel.IntegerEnum.I_FOO},
+    ]
+    assert isinstance(values[0]["c_field"], MyModel.TextEnum)
+
+    values_list = list(
+        MyModel.choices_objects.order_by("pk").values_list("pk", "if_field_nullable"),
+    )
+    assert [v[1] for v in values_list] == [None, MyModel.IntegerFlagEnum.IF_BAR]
+
+    flat = list(MyModel.choices_objects.order_by("pk").values_list("i_field", flat=True))
+    assert flat == [MyModel.IntegerEnum.I_BAR, MyModel.IntegerEnum.I_FOO]
+    assert isinstance(flat[0], MyModel.IntegerEnum)
+
+
+def test_queryset_hydrates_iterator(db):
+    _create_objects()
+
+    objs = list(MyModel.choices_objects.order_by("pk").iterator(chunk_size=1))
+    assert [o.c_field for o in objs] == [MyModel.TextEnum.C_BAR, MyModel.TextEnum.C_FOO]
+
+
+def test_queryset_annotations_use_default_converters(db):
+    _create_objects()
+
+    values = list(
+        MyModel.choices_objects.order_by("pk").annotate(c=F("c_field")).values_list("c", flat=True),
+    )
+    assert values == [MyModel.TextEnum.C_BAR, MyModel.TextEnum.C_FOO]
+
+
+def test_queryset_empty(db):
+    assert list(MyModel.choices_objects.none()) == []
+    assert list(MyModel.choices_objects.all()) == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Requires Python 3.11+ to work properly")
+def test_queryset_hydrates_flag_combinations(db):
+    MyModel.objects.create(if_field=MyModel.IntegerFlagEnum.IF_FOO | MyModel.IntegerFlagEnum.IF_BIN)
+
+    obj = MyModel.choices_objects.get()
+    assert obj.if_field == MyModel.IntegerFlagEnum.IF_FOO | MyModel.IntegerFlagEnum.IF_BIN
+    assert isinstance(obj.if_field, MyModel.IntegerFlagEnum)
+
+
+def test_queryset_invalid_value(db):
+    _create_objects()
+    with connection.cursor() as cursor:
+        cursor.execute(f"UPDATE {MyModel._meta.db_table} SET c_field = 'invalid'")
+
+    with pytest.raises(ValidationError):
+        list(MyModel.choices_objects.all())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Requires Python 3.11+ to work properly")
+def test_flag_lookups(db):
+    flags = MyModel.IntegerFlagEnum
+    foo = MyModel.objects.create(if_field=flags.IF_FOO)
+    foo_bar = MyModel.objects.create(if_field=flags.IF_FOO | flags.IF_BAR)
+    bin_ = MyModel.objects.create(if_field=flags.IF_BIN, if_field_nullable=flags.IF_BIN)
+
+    def pks(**kwargs):
+        return set(MyModel.objects.filter(**kwargs).values_list("pk", flat=True))
+
+    assert pks(if_field__has_all=flags.IF_FOO) == {foo.pk, foo_bar.pk}
+    assert pks(if_field__has_all=flags.IF_FOO | flags.IF_BAR) == {foo_bar.pk}
+    assert pks(if_field__has_all=flags.IF_BAR | flags.IF_BIN) == set()
+    assert pks(if_field__has_any=flags.IF_BAR | flags.IF_BIN) == {foo_bar.pk, bin_.pk}
+    assert pks(if_field__has_any=3) == {foo.pk, foo_bar.pk}
+    assert pks(if_field__has_none=flags.IF_FOO) == {bin_.pk}
+    assert pks(if_field__has_none=flags.IF_FOO | flags.IF_BIN) == set()
+
+    # NULL never matches
+    assert pks(if_field_nullable__has_none=flags.IF_FOO) == {bin_.pk}
+    assert pks(if_field_nullable__has_any=flags.IF_BIN) == {bin_.pk}
+
+
+def test_flag_lookups_invalid_value(db):
+    with pytest.raises(ValidationError):
+        list(MyModel.objects.filter(if_field__has_any=8))
+
+
+def test_flag_lookups_sql():
+    sql = str(MyModel.objects.filter(if_field__has_all=3).query)
+    assert '("tests_mymodel"."if_field" & 3) = 3' in sql